@@ -0,0 +1,166 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from shredder import CHUNK_SIZE, WIPE_METHODS, Shredder
+from durability import DURABILITY_MODES, Durability
+from phases import RunTimings
+from chunking import parse_size
+from cli import wipe_targets
+
+CORPORA = ("tiny", "huge", "sparse", "deep")
+DEFAULT_CHUNKS = (1024 * 1024, CHUNK_SIZE)
+MB = 1024 * 1024
+
+def _fill(path: Path, size: int, block: bytes):
+    with open(path, "wb") as f:
+        left = size
+        while left > 0:
+            n = min(len(block), left)
+            f.write(block[:n])
+            left -= n
+
+def make_corpus(kind: str, root: Path, scale: float = 1.0) -> Tuple[int, int]:
+    root.mkdir(parents=True, exist_ok=True)
+    block = os.urandom(MB)
+    files = 0; nbytes = 0
+    if kind == "tiny":
+        for d in range(max(1, int(10 * scale))):
+            sub = root / f"d{d:03d}"
+            sub.mkdir()
+            for i in range(500):
+                _fill(sub / f"f{i:04d}", 1024, block)
+                files += 1; nbytes += 1024
+    elif kind == "huge":
+        size = max(MB, int(128 * MB * scale))
+        for i in range(2):
+            _fill(root / f"huge{i}.bin", size, block)
+            files += 1; nbytes += size
+    elif kind == "sparse":
+        size = max(16 * MB, int(256 * MB * scale))
+        for i in range(4):
+            p = root / f"sparse{i}.img"
+            with open(p, "wb") as f:
+                for off in range(0, size, 16 * MB):
+                    f.seek(off)
+                    f.write(block)
+                f.truncate(size)
+            files += 1; nbytes += size
+    elif kind == "deep":
+        depth = max(2, int(24 * scale))
+        d = root
+        for level in range(depth):
+            d = d / f"l{level:02d}"
+            d.mkdir()
+            for i in range(8):
+                _fill(d / f"f{i}", 16 * 1024, block)
+                files += 1; nbytes += 16 * 1024
+    else:
+        raise ValueError(f"Unknown corpus: {kind}")
+    return files, nbytes
+
+def peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+def run_case(kind: str, method: str, chunk: int, base: Path, scale: float = 1.0,
+             durability: str = "fsync", per_device: int = 1) -> Dict:
+    root = Path(tempfile.mkdtemp(prefix=f"bench-{kind}-", dir=base))
+    try:
+        files, nbytes = make_corpus(kind, root / "corpus", scale)
+        timings = RunTimings()
+        shred = Shredder(lambda msg: None, durability=Durability(durability), timings=timings)
+        ok = fail = written = 0
+        t0 = time.perf_counter()
+        for rr in wipe_targets(shred, [root / "corpus"], method, False, 0, per_device, chunk):
+            if rr.result == "DELETED":
+                ok += 1
+                written += rr.bytes_written
+            else:
+                fail += 1
+        elapsed = time.perf_counter() - t0
+        fsyncs = sum(timings.hist["fsync_pass"])
+        return {
+            "corpus": kind, "method": method, "chunk": chunk, "durability": durability, "scale": scale,
+            "files": files, "bytes": nbytes, "written": written, "ok": ok, "fail": fail,
+            "seconds": round(elapsed, 6),
+            "mb_s": round(written / MB / elapsed, 3) if elapsed > 0 else 0.0,
+            "files_s": round(ok / elapsed, 3) if elapsed > 0 else 0.0,
+            "fsyncs": fsyncs,
+            "fsyncs_s": round(fsyncs / elapsed, 3) if elapsed > 0 else 0.0,
+            "peak_rss_kb": peak_rss_kb(),
+            "phases": timings.summary()["phases"],
+        }
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+def default_base(tmpfs: bool) -> Path:
+    if tmpfs and Path("/dev/shm").is_dir():
+        return Path("/dev/shm")
+    return Path(tempfile.gettempdir())
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="bench.py", description="Synthetic wipe benchmarks (JSONL results)")
+    ap.add_argument("--dir", metavar="DIR", help="scratch directory (default: system temp dir)")
+    ap.add_argument("--tmpfs", action="store_true", help="use /dev/shm as scratch directory")
+    ap.add_argument("--corpus", action="append", choices=CORPORA, help="corpus to run (repeatable, default: all)")
+    ap.add_argument("--method", action="append", choices=WIPE_METHODS, help="method to run (repeatable, default: all)")
+    ap.add_argument("--chunk", action="append", type=parse_size, metavar="SIZE",
+                    help="chunk size, e.g. 1M (repeatable, default: 1M and 8M)")
+    ap.add_argument("--scale", type=float, default=1.0, help="corpus size multiplier")
+    ap.add_argument("--durability", choices=DURABILITY_MODES, default="fsync")
+    ap.add_argument("-j", "--jobs-per-device", type=int, default=1, metavar="N")
+    ap.add_argument("-o", "--output", metavar="FILE", help="append JSONL results to FILE instead of stdout")
+    ap.add_argument("--in-process", action="store_true",
+                    help="run all cases in this process (peak RSS is then cumulative)")
+    ap.add_argument("--case", help=argparse.SUPPRESS)
+    return ap
+
+def _child(args, kind: str, method: str, chunk: int, base: Path) -> Dict:
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--case", f"{kind},{method},{chunk}", "--dir", str(base),
+           "--scale", str(args.scale), "--durability", args.durability, "-j", str(args.jobs_per_device)]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    base = Path(args.dir) if args.dir else default_base(args.tmpfs)
+    if args.case:
+        kind, method, chunk = args.case.split(",")
+        print(json.dumps(run_case(kind, method, int(chunk), base, args.scale, args.durability, args.jobs_per_device)))
+        return 0
+    out = open(args.output, "a", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for kind in args.corpus or CORPORA:
+            for method in args.method or WIPE_METHODS:
+                for chunk in args.chunk or DEFAULT_CHUNKS:
+                    if args.in_process:
+                        res = run_case(kind, method, chunk, base, args.scale, args.durability, args.jobs_per_device)
+                    else:
+                        res = _child(args, kind, method, chunk, base)
+                    out.write(json.dumps(res) + "\n")
+                    out.flush()
+                    print(f"{kind:<7} {method:<8} {chunk // 1024:>6} KB  {res['mb_s']:>9.1f} MB/s  "
+                          f"{res['files_s']:>9.1f} files/s  {res['fsyncs_s']:>9.1f} fsyncs/s  "
+                          f"rss {res['peak_rss_kb']} KB", file=sys.stderr)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import os
+import time
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from durability import fdatasync
+
+MB = 1024 * 1024
+DEFAULT_CHUNK = 8 * MB
+PROBE_CANDIDATES = (1 * MB, 4 * MB, 8 * MB, 16 * MB)
+PROBE_BYTES = 32 * MB
+PROBE_MIN_FILE = 256 * MB
+
+def parse_size(s: str) -> int:
+    s = s.strip().upper()
+    mult = {"K": 1024, "M": MB, "G": 1024 * MB}.get(s[-1:], 1)
+    return int(float(s[:-1] if mult > 1 else s) * mult)
+
+def align(n: int, blk: int) -> int:
+    return max(blk, n - n % blk)
+
+class ChunkPolicy:
+    def __init__(self, default: int = DEFAULT_CHUNK, probe: bool = True, probe_min: int = PROBE_MIN_FILE,
+                 probe_bytes: int = PROBE_BYTES, candidates: Tuple[int, ...] = PROBE_CANDIDATES, log=None):
+        self.default = default
+        self.probe = probe
+        self.probe_min = probe_min
+        self.probe_bytes = probe_bytes
+        self.candidates = candidates
+        self.log = log
+        self._devices: Dict[int, Tuple[int, str]] = {}
+        self._locks: Dict[int, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_chunk(self) -> int:
+        return max(self.default, *self.candidates)
+
+    def choose(self, p: Path, st: os.stat_result, gate: Optional[Callable[[int], None]] = None) -> Tuple[int, str]:
+        blk = max(4096, getattr(st, "st_blksize", 0) or 4096)
+        if self.probe and st.st_size >= self.probe_min:
+            chunk, how = self._device_chunk(p, st.st_dev, blk, gate)
+        else:
+            chunk, how = align(self.default, blk), "blksize"
+        if st.st_size < chunk:
+            chunk = max(blk, -(-st.st_size // blk) * blk)
+            how = "size"
+        return chunk, how
+
+    def _device_chunk(self, p: Path, dev: int, blk: int,
+                      gate: Optional[Callable[[int], None]]) -> Tuple[int, str]:
+        with self._lock:
+            hit = self._devices.get(dev)
+            if hit is not None:
+                return hit
+            lock = self._locks.setdefault(dev, threading.Lock())
+        with lock:
+            hit = self._devices.get(dev)
+            if hit is None:
+                try:
+                    hit = self._probe(p, blk, gate), "probe"
+                except OSError as e:
+                    hit = align(self.default, blk), "blksize"
+                    if self.log is not None:
+                        self.log(f"[WARN] chunk probe failed on {p}: {e}")
+                if self.log is not None:
+                    self.log(f"[INFO] chunk size for device {dev}: {hit[0] // 1024} KB ({hit[1]})")
+                with self._lock:
+                    self._devices[dev] = hit
+        return hit
+
+    def _probe(self, p: Path, blk: int, gate: Optional[Callable[[int], None]]) -> int:
+        fd = os.open(p, os.O_WRONLY | getattr(os, "O_NOFOLLOW", 0))
+        try:
+            seek_data = getattr(os, "SEEK_DATA", None)
+            if seek_data is not None and (os.lseek(fd, 0, seek_data) != 0
+                                          or os.lseek(fd, 0, os.SEEK_HOLE) < self.probe_bytes):
+                raise OSError(f"first {self.probe_bytes // MB} MB not allocated")
+            warm = bytes(MB)
+            os.lseek(fd, 0, os.SEEK_SET)
+            for _ in range(self.probe_bytes // MB):
+                if gate is not None:
+                    gate(MB)
+                os.write(fd, warm)
+            fdatasync(fd)
+            best, best_rate = align(self.default, blk), 0.0
+            for c in sorted({align(c, blk) for c in self.candidates}):
+                buf = bytes(c)
+                os.lseek(fd, 0, os.SEEK_SET)
+                t0 = time.perf_counter()
+                written = 0
+                while written < self.probe_bytes:
+                    if gate is not None:
+                        g0 = time.perf_counter()
+                        gate(c)
+                        t0 += time.perf_counter() - g0
+                    written += os.write(fd, buf)
+                fdatasync(fd)
+                rate = written / max(time.perf_counter() - t0, 1e-9)
+                if rate > best_rate * 1.05:
+                    best, best_rate = c, rate
+            return best
+        finally:
+            os.close(fd)
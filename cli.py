@@ -0,0 +1,284 @@
+import sys
+import signal
+import threading
+import argparse
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union
+
+from shredder import (APP_NAME, APP_VERSION, CHUNK_SIZE, OK_RESULTS, WIPE_METHODS, ReportRow, Shredder,
+                      method_passes, remove_empty_dirs)
+from scheduler import WipeScheduler
+from planner import WipePlan, build_plan
+from random_source import RANDOM_SOURCES, make_random_source
+from durability import DURABILITY_MODES, Durability
+from logsink import LEVELS, JsonlSink, LogPipeline
+from reporting import REPORT_FORMATS, ReportWriter
+from journal import JOB_SETTINGS, Job
+from phases import RunTimings, ThreadProfiles
+from chunking import ChunkPolicy, parse_size
+from directio import IO_MODES
+from offload import OFFLOAD_MODES, Offload
+from freespace import FreeSpaceWiper, parse_reserve
+from throttle import Throttle, apply_priority, parse_ionice
+from verify import DEFAULT_COVERAGE, VERIFY_MODES, Verifier
+
+def iter_targets(paths: Iterable[str], lists: Iterable[str]) -> Iterator[Path]:
+    for p in paths:
+        yield Path(p)
+    for src in lists:
+        f = sys.stdin if src == "-" else open(src, encoding="utf-8")
+        try:
+            for line in f:
+                line = line.rstrip("\r\n")
+                if line and not line.startswith("#"):
+                    yield Path(line)
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+def plan_targets(targets: Iterable[Path]) -> WipePlan:
+    return build_plan((p, p, True) for p in targets)
+
+def wipe_targets(shred: Shredder, targets: Union[WipePlan, Iterable[Path]], method: str, verify_fixed: bool,
+                 rename_times: int, per_device: int = 1, chunk_size: int = CHUNK_SIZE) -> Iterator[ReportRow]:
+    plan = targets if isinstance(targets, WipePlan) else plan_targets(targets)
+    sched = WipeScheduler(shred, method, verify_fixed, rename_times, per_device=per_device, chunk_size=chunk_size)
+    for target, rr in sched.run(plan.jobs()):
+        if rr is None:
+            remove_empty_dirs(target)
+            if shred.journal is not None and not target.exists():
+                shred.journal.target_done(target)
+        else:
+            yield rr
+
+def chunk_arg(s: str) -> str:
+    if s == "auto":
+        return s
+    try:
+        n = parse_size(s)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {s}")
+    if n <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0: {s}")
+    return s
+
+def reserve_arg(s: str) -> str:
+    try:
+        parse_reserve(s)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid reserve: {s}")
+    return s
+
+def toggle_pause(shred: Shredder, log):
+    if shred.paused:
+        shred.resume()
+        msg = "[INFO] resumed"
+    else:
+        shred.pause()
+        msg = "[INFO] paused (send SIGUSR1 again to resume)"
+    threading.Thread(target=log, args=(msg,), daemon=True).start()
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="app.py", description=f"{APP_NAME} {APP_VERSION}")
+    ap.add_argument("--version", action="version", version=f"{APP_NAME} {APP_VERSION}")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    out = argparse.ArgumentParser(add_help=False)
+    out.add_argument("--format", choices=REPORT_FORMATS, help="report output format (default: jsonl, or from -o suffix)")
+    out.add_argument("-o", "--output", metavar="FILE",
+                     help="append report to FILE (fsync checkpoints) instead of writing to stdout")
+    out.add_argument("-q", "--quiet", action="store_true", help="suppress engine log on stderr")
+    out.add_argument("--log-level", choices=tuple(LEVELS), default="INFO",
+                     help="minimum log level (DEBUG includes per-pass lines)")
+    out.add_argument("--log-file", metavar="FILE", help="append structured log lines (JSONL) to FILE")
+    out.add_argument("--timings", action="store_true",
+                     help="record per-phase time/bytes as extra report columns and log run histograms")
+    out.add_argument("--profile", metavar="FILE", help="run the engine under cProfile and dump pstats to FILE")
+    out.add_argument("-y", "--yes", action="store_true", help="confirm irreversible deletion")
+    out.add_argument("--dry-run", action="store_true",
+                     help="only print the plan (unique files after merging overlaps and hardlinks, bytes × passes)")
+    out.add_argument("--limit-mbps", type=float, default=0.0, metavar="MB",
+                     help="cap write and verify bandwidth at MB MiB/s across all workers (0 = unlimited)")
+    out.add_argument("--limit-iops", type=float, default=0.0, metavar="N",
+                     help="cap chunk I/O operations per second across all workers (0 = unlimited)")
+    out.add_argument("--ionice", type=parse_ionice, metavar="CLASS[:LEVEL]",
+                     help="Linux I/O scheduling class for the process: idle, be or rt, level 0-7 (default 4)")
+    out.add_argument("--nice", type=int, default=0, metavar="N", help="raise the process niceness by N")
+
+    w = sub.add_parser("wipe", parents=[out], help="overwrite and delete files/folders")
+    w.add_argument("paths", nargs="*", metavar="PATH")
+    w.add_argument("--method", choices=WIPE_METHODS, default="DOD3")
+    w.add_argument("--verify", action="store_true", help="verify every pass against a digest taken while writing")
+    w.add_argument("--verify-mode", choices=VERIFY_MODES, default="full",
+                   help="full read-back (default) or sampled random blocks")
+    w.add_argument("--verify-coverage", type=float, default=DEFAULT_COVERAGE * 100, metavar="PCT",
+                   help="share of 1 MiB blocks read back per pass with --verify-mode sampled (default: 1)")
+    w.add_argument("--renames", type=int, default=0, metavar="N", help="random renames before delete")
+    w.add_argument("-j", "--jobs-per-device", type=int, default=1, metavar="N",
+                   help="concurrent file wipes per storage device (default: 1)")
+    w.add_argument("--random", choices=RANDOM_SOURCES, default="urandom",
+                   help="random pass source: kernel urandom or userspace SHAKE-128 keystream")
+    w.add_argument("--prefetch", type=int, default=0, metavar="N",
+                   help="pre-generate up to N random chunks on a background thread")
+    w.add_argument("--pipeline", type=int, default=2, metavar="N",
+                   help="buffers in the random-pass generate/write pipeline for large files (0/1 = off)")
+    w.add_argument("--durability", choices=DURABILITY_MODES, default="fsync",
+                   help="fsync/fdatasync after every pass, sync_file_range writeback for big files, "
+                        "or group commit (one syncfs per batch of files)")
+    w.add_argument("--group-files", type=int, default=256, metavar="N", help="files per group commit batch")
+    w.add_argument("--chunk", type=chunk_arg, default="auto", metavar="SIZE",
+                   help="write chunk size, e.g. 4M, or 'auto': st_blksize, file size and a per-device probe "
+                        "for files >= 256 MB (default)")
+    w.add_argument("--io", choices=IO_MODES, default="buffered",
+                   help="direct: O_DIRECT writes/verify from aligned mmap buffers (falls back to fadvise); "
+                        "fadvise: drop written pages with POSIX_FADV_DONTNEED so verify reads the device")
+    w.add_argument("--offload", choices=OFFLOAD_MODES, default="none",
+                   help="write fixed-pattern passes in the kernel from an in-memory pattern file "
+                        "(copy_file_range, sendfile; auto tries both) instead of the write loop")
+    w.add_argument("--free-space", action="append", default=[], metavar="MOUNT",
+                   help="after the targets, fill the free space of MOUNT with the method's first pass and shred "
+                        "the fill files (repeatable)")
+    w.add_argument("--fill-workers", type=int, default=4, metavar="N", help="parallel writers for --free-space")
+    w.add_argument("--fill-reserve", type=reserve_arg, default="64M", metavar="SIZE|PCT",
+                   help="free space --free-space leaves untouched, e.g. 1G or 5%% of the volume (default: 64M)")
+    w.add_argument("--from", dest="lists", action="append", default=[], metavar="FILE",
+                   help="read target paths from FILE, one per line ('-' for stdin)")
+    w.add_argument("--job", metavar="NAME",
+                   help="record targets and per-file progress in ~/.datashredder/jobs/NAME for 'resume'")
+
+    r = sub.add_parser("resume", parents=[out], help="continue an interrupted --job")
+    r.add_argument("job", metavar="NAME")
+    return ap
+
+def cmd_wipe(args) -> int:
+    if not args.paths and not args.lists and not args.free_space:
+        print("error: no targets given", file=sys.stderr)
+        return 2
+    if not 0 < args.verify_coverage <= 100:
+        print(f"error: invalid --verify-coverage: {args.verify_coverage}", file=sys.stderr)
+        return 2
+    settings = {k: getattr(args, k) for k in JOB_SETTINGS}
+    targets = iter_targets(args.paths, args.lists)
+    if args.dry_run or not args.yes:
+        return preview(args, settings, targets)
+    job = None
+    if args.job:
+        try:
+            job = Job.create(args.job, settings)
+        except (OSError, ValueError) as e:
+            print(f"error: cannot create job: {e}", file=sys.stderr)
+            return 2
+        job.add_targets(targets)
+        targets = None
+    return run_wipe(args, settings, targets, job)
+
+def cmd_resume(args) -> int:
+    try:
+        job = Job.open(args.job)
+    except (OSError, ValueError) as e:
+        print(f"error: cannot open job: {e}", file=sys.stderr)
+        return 2
+    if job.finished:
+        print(f"job {job.name} already finished", file=sys.stderr)
+        return 0
+    if args.dry_run or not args.yes:
+        return preview(args, job.settings, job.targets(job.journal()))
+    return run_wipe(args, job.settings, None, job)
+
+def preview(args, settings: dict, targets: Iterable[Path]) -> int:
+    plan = plan_targets(targets)
+    for line in plan.lines(len(method_passes(settings["method"]))):
+        print(line, file=sys.stderr)
+    if args.dry_run:
+        return 0
+    print("error: refusing to wipe without --yes (operation is irreversible)", file=sys.stderr)
+    return 2
+
+def run_wipe(args, settings: dict, targets: Optional[Iterable[Path]], job: Optional[Job]) -> int:
+    sink = JsonlSink(args.log_file) if args.log_file else None
+    echo = None if args.quiet else (lambda msg: print(msg, file=sys.stderr, flush=True))
+    log = LogPipeline(args.log_level, max_lines=0, sink=sink, echo=echo)
+    rnd = make_random_source(settings["random"], settings["prefetch"])
+    journal = job.journal() if job is not None else None
+    if targets is None:
+        targets = job.targets(journal)
+    chunk = settings.get("chunk", "auto")
+    policy = ChunkPolicy(CHUNK_SIZE, log=log) if chunk == "auto" else None
+    chunk_size = CHUNK_SIZE if chunk == "auto" else parse_size(chunk)
+    timings = RunTimings() if args.timings else None
+    profiler = ThreadProfiles(log) if args.profile else None
+    offload = Offload(settings.get("offload", "none"))
+    apply_priority(args.ionice, args.nice, log)
+    throttle = Throttle(args.limit_mbps, args.limit_iops)
+    verify = settings["verify"]
+    mode = settings.get("verify_mode") or (verify if verify in VERIFY_MODES else "full")
+    verifier = Verifier(mode, settings.get("verify_coverage", DEFAULT_COVERAGE * 100) / 100)
+    shred = Shredder(log, rnd, pipeline_depth=settings["pipeline"],
+                     durability=Durability(settings["durability"], settings["group_files"]), journal=journal,
+                     timings=timings, profiler=profiler, chunk_policy=policy,
+                     io_mode=settings.get("io", "buffered"), offload=offload, throttle=throttle,
+                     verifier=verifier)
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda *_: toggle_pause(shred, log))
+    if args.output:
+        writer = ReportWriter.open(Path(args.output), args.format)
+    else:
+        writer = ReportWriter(sys.stdout, args.format or "jsonl", live=True)
+    counts = [0, 0]
+
+    def consume():
+        plan = plan_targets(targets)
+        for line in plan.lines(len(method_passes(settings["method"]))):
+            log(line)
+        for rr in wipe_targets(shred, plan, settings["method"], bool(verify), settings["renames"],
+                               settings["jobs_per_device"], chunk_size):
+            writer.write(rr)
+            counts[rr.result not in OK_RESULTS] += 1
+        reserve, reserve_pct = parse_reserve(settings.get("fill_reserve", "64M"))
+        free = FreeSpaceWiper(shred, settings.get("fill_workers", 4), reserve=reserve, chunk_size=chunk_size,
+                              reserve_pct=reserve_pct)
+        for mount in settings.get("free_space", []):
+            if shred.cancelled:
+                break
+            rr = free.wipe(Path(mount), settings["method"], bool(verify))
+            writer.write(rr)
+            counts[rr.result not in OK_RESULTS] += 1
+
+    try:
+        if profiler is not None:
+            profiler.run(consume)
+        else:
+            consume()
+        ok, fail = counts
+        log(f"[INFO] Done. Success: {ok}, Failures: {fail}")
+        if timings is not None:
+            for line in timings.lines():
+                log(line)
+        if job is not None and fail == 0:
+            job.mark_finished()
+        elif job is not None:
+            log(f"[INFO] job {job.name} can be continued with: resume {job.name}")
+        return 0 if fail == 0 else 1
+    except KeyboardInterrupt:
+        shred.cancel()
+        log("[INFO] cancelled")
+        if job is not None:
+            log(f"[INFO] job {job.name} can be continued with: resume {job.name}")
+        return 130
+    finally:
+        if profiler is not None and profiler.dump(args.profile):
+            log(f"[INFO] profile written to {args.profile}")
+        rnd.close()
+        offload.close()
+        if journal is not None:
+            journal.close()
+        log.close()
+        writer.close()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.cmd == "wipe":
+        return cmd_wipe(args)
+    if args.cmd == "resume":
+        return cmd_resume(args)
+    return 2
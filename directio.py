@@ -0,0 +1,42 @@
+import os
+import mmap
+import errno
+from typing import Optional
+
+IO_MODES = ("buffered", "direct", "fadvise")
+
+ALIGN = 4096
+
+DIRECT_SUPPORTED = hasattr(os, "O_DIRECT")
+FADVISE_SUPPORTED = hasattr(os, "posix_fadvise") and hasattr(os, "POSIX_FADV_DONTNEED")
+
+def aligned_len(n: int) -> int:
+    return max(ALIGN, -(-n // ALIGN) * ALIGN)
+
+def aligned_buffer(n: int) -> memoryview:
+    return memoryview(mmap.mmap(-1, aligned_len(n)))
+
+def open_direct(path) -> Optional[int]:
+    if not DIRECT_SUPPORTED:
+        return None
+    try:
+        return os.open(path, os.O_RDWR | os.O_DIRECT | getattr(os, "O_NOFOLLOW", 0))
+    except OSError as e:
+        if e.errno in (errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP):
+            return None
+        raise
+
+def drop_cache(fd: int, offset: int = 0, length: int = 0) -> bool:
+    if not FADVISE_SUPPORTED:
+        return False
+    os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
+    return True
+
+def resolve_mode(mode: str) -> str:
+    if mode not in IO_MODES:
+        raise ValueError(f"Unknown I/O mode: {mode}")
+    if mode == "direct" and not DIRECT_SUPPORTED:
+        mode = "fadvise"
+    if mode == "fadvise" and not FADVISE_SUPPORTED:
+        mode = "buffered"
+    return mode
@@ -0,0 +1,94 @@
+import os
+import sys
+import ctypes
+import ctypes.util
+import threading
+from typing import List
+
+DURABILITY_MODES = ("fsync", "fdatasync", "writeback", "group")
+
+SYNC_FILE_RANGE_WAIT_BEFORE = 1
+SYNC_FILE_RANGE_WRITE = 2
+SYNC_FILE_RANGE_WAIT_AFTER = 4
+
+_libc = None
+_libc_lock = threading.Lock()
+
+def _load_libc():
+    global _libc
+    with _libc_lock:
+        if _libc is None:
+            _libc = False
+            if sys.platform.startswith("linux"):
+                try:
+                    lib = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+                    lib.sync_file_range.argtypes = [ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong, ctypes.c_uint]
+                    lib.syncfs.argtypes = [ctypes.c_int]
+                    _libc = lib
+                except (OSError, AttributeError):
+                    pass
+    return _libc or None
+
+def fdatasync(fd: int):
+    if hasattr(os, "fdatasync"):
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+def sync_file_range(fd: int, offset: int = 0, nbytes: int = 0) -> bool:
+    lib = _load_libc()
+    if lib is None:
+        return False
+    flags = SYNC_FILE_RANGE_WAIT_BEFORE | SYNC_FILE_RANGE_WRITE | SYNC_FILE_RANGE_WAIT_AFTER
+    if lib.sync_file_range(fd, offset, nbytes, flags) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return True
+
+def syncfs_supported() -> bool:
+    return _load_libc() is not None
+
+def syncfs(fd: int) -> bool:
+    lib = _load_libc()
+    if lib is None:
+        return False
+    if lib.syncfs(fd) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return True
+
+class Durability:
+    def __init__(self, mode: str = "fsync", group_files: int = 256, writeback_min: int = 64 * 1024 * 1024):
+        if mode not in DURABILITY_MODES:
+            raise ValueError(f"Unknown durability mode: {mode}")
+        self.mode = mode
+        self.group_files = max(1, group_files)
+        self.writeback_min = writeback_min
+
+    @property
+    def batched(self) -> bool:
+        return self.mode == "group"
+
+    def sync_pass(self, fd: int, size: int) -> str:
+        if self.mode == "fsync":
+            os.fsync(fd)
+            return "fsync/pass"
+        if self.mode == "writeback" and size >= self.writeback_min and sync_file_range(fd):
+            return "sync_file_range/pass+fdatasync"
+        if self.mode in ("fdatasync", "writeback"):
+            fdatasync(fd)
+            return "fdatasync/pass"
+        return "none/pass"
+
+    def sync_file(self, fd: int, label: str):
+        if label.startswith("sync_file_range"):
+            fdatasync(fd)
+
+    def sync_batch(self, fds: List[int]) -> str:
+        if not fds:
+            return ""
+        if syncfs(fds[0]):
+            return "syncfs/batch"
+        for fd in fds:
+            os.fsync(fd)
+        return "fsync/batch"
@@ -0,0 +1,172 @@
+import os
+import errno
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from shredder import CHUNK_SIZE, ReportRow, Shredder
+from chunking import MB, parse_size
+from directio import drop_cache
+
+FILL_PREFIX = ".shred-free-"
+FILL_FILE_SIZE = 1024 * 1024 * 1024
+FILL_RESERVE = 64 * 1024 * 1024
+
+def parse_reserve(s: str) -> Tuple[int, float]:
+    s = s.strip()
+    if s.endswith("%"):
+        pct = float(s[:-1])
+        if not 0 <= pct < 100:
+            raise ValueError(f"Reserve out of range: {s}")
+        return 0, pct
+    n = parse_size(s)
+    if n < 0:
+        raise ValueError(f"Reserve out of range: {s}")
+    return n, 0.0
+
+def free_bytes(path: Path) -> int:
+    return shutil.disk_usage(path).free
+
+def remove_stale_fill_dirs(mount: Path):
+    try:
+        with os.scandir(mount) as it:
+            for entry in it:
+                if entry.name.startswith(FILL_PREFIX) and entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+    except OSError:
+        pass
+
+class FreeSpaceWiper:
+    def __init__(self, shred: Shredder, workers: int = 4, file_size: int = FILL_FILE_SIZE,
+                 reserve: int = FILL_RESERVE, chunk_size: int = CHUNK_SIZE, reserve_pct: float = 0.0):
+        self.shred = shred
+        self.workers = max(1, workers)
+        self.file_size = file_size
+        self.reserve = reserve
+        self.reserve_pct = reserve_pct
+        self.chunk_size = chunk_size
+        self._reserve = reserve
+
+    def wipe(self, mount: Path, method: str, verify_fixed: bool) -> ReportRow:
+        shred = self.shred
+        start = time.time()
+        passes = shred._method_passes(method)
+        remove_stale_fill_dirs(mount)
+        try:
+            total = shutil.disk_usage(mount).total
+            fill_dir = Path(tempfile.mkdtemp(prefix=FILL_PREFIX, dir=mount))
+        except OSError as e:
+            return ReportRow(str(mount), method, 0, 0, 0, "NO", 0.0, "ERROR", str(e))
+        self._reserve = int(total * self.reserve_pct / 100) if self.reserve_pct else self.reserve
+        shred.log(f"[INFO] filling free space on {mount} ({free_bytes(mount) // MB} MB, {self.workers} workers, "
+                  f"{len(passes)} passes, reserve {self._reserve // MB} MB)")
+        errors: List[str] = []
+        filled = done = 0
+        try:
+            for i, pattern in enumerate(passes, 1):
+                if shred.cancelled or errors:
+                    break
+                files: List[Tuple[Path, int]] = []
+                stop = threading.Event()
+                self._run(self._fill, fill_dir, pattern, verify_fixed, stop, files, errors)
+                n = sum(k for _, k in files)
+                filled = max(filled, n)
+                self._release(files, errors)
+                shred.log(f"[PASS] free space {mount}: pass {i}/{len(passes)} filled {n // MB} MB "
+                          f"in {len(files)} files, released")
+                if not errors and not shred.cancelled:
+                    done += 1
+        finally:
+            shutil.rmtree(fill_dir, ignore_errors=True)
+        error = "; ".join(errors[:3])
+        if shred.cancelled and not error:
+            error = "Cancelled"
+        if error:
+            verified = "NO"
+        else:
+            verified = shred.verifier.level if verify_fixed and filled else "N/A"
+        io = "buffered" if shred.io_mode == "buffered" else "fadvise"
+        return ReportRow(str(mount), method, filled, done if not error else 0, 0, verified,
+                         time.time() - start, "ERROR" if error else "WIPED", error, "fsync", filled,
+                         self.chunk_size, io, "fill")
+
+    def _release(self, files: List[Tuple[Path, int]], errors: List[str]):
+        for fp, _ in files:
+            try:
+                fp.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                errors.append(f"{fp.name}: {e}")
+
+    def _run(self, target, *args):
+        threads = [threading.Thread(target=target, args=(i,) + args, name=f"shred-free-{i}", daemon=True)
+                   for i in range(self.workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def _low(self, d: Path) -> bool:
+        try:
+            return free_bytes(d) - self.chunk_size < self._reserve
+        except OSError:
+            return True
+
+    def _fill(self, idx: int, d: Path, pattern: Optional[int], verify: bool, stop: threading.Event,
+              files: List[Tuple[Path, int]], errors: List[str]):
+        shred = self.shred
+        shred._local.ph = None
+        shred._local.written = 0
+        chunk = self.chunk_size
+        pat = None if pattern is None else shred.patterns.get(pattern, chunk)
+        rbuf = memoryview(bytearray(chunk)) if pat is None else None
+        n = 0
+        while not stop.is_set() and not shred.cancelled:
+            fp = d / f"fill-{idx:03d}-{n:06d}"
+            n += 1
+            written = 0
+            tap = shred.verifier.stream_tap() if verify else None
+            try:
+                with open(fp, "w+b", buffering=0) as f:
+                    while written < self.file_size:
+                        if shred.cancelled or stop.is_set() or self._low(d):
+                            stop.set()
+                            break
+                        shred._gate(chunk)
+                        buf = pat
+                        if rbuf is not None:
+                            shred.random.readinto(rbuf)
+                            buf = rbuf
+                        w = f.write(buf) or 0
+                        written += w
+                        if tap is not None:
+                            tap.update(memoryview(buf)[:w])
+                        shred._advance(w)
+                        if w < len(buf):
+                            stop.set()
+                            break
+                    os.fsync(f.fileno())
+                    if tap is not None and written:
+                        if shred.io_mode != "buffered":
+                            drop_cache(f.fileno())
+                        tap.written(written)
+                        if not tap.check(shred._reader(f, None, chunk), chunk):
+                            stop.set()
+                            errors.append(f"{fp.name}: Verification failed")
+            except OSError as e:
+                stop.set()
+                if e.errno not in (errno.ENOSPC, errno.EDQUOT):
+                    errors.append(f"{fp.name}: {e}")
+            except RuntimeError:
+                stop.set()
+            if written:
+                files.append((fp, written))
+            else:
+                try:
+                    fp.unlink()
+                except OSError:
+                    pass
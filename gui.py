@@ -0,0 +1,723 @@
+import time
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+from shredder import (APP_NAME, APP_AUTHOR, APP_VERSION, CHUNK_SIZE, GITHUB_URL, OK_RESULTS, WIPE_METHODS,
+                      WipeMethod, TargetItem, ReportRow, Shredder, human_size, method_passes, remove_empty_dirs)
+from scheduler import WipeScheduler
+from smallfiles import iter_files
+from planner import WipePlan, build_plan
+from logsink import LogPipeline
+from progress import Progress, ProgressInfo
+from chunking import ChunkPolicy
+from throttle import Throttle
+from verify import Verifier
+from reporting import ReportWriter, export_report, new_report_path
+
+I18N = {
+    "de": {
+        "title": f"{APP_NAME} v{APP_VERSION} - {APP_AUTHOR}",
+        "add_files": "Dateien hinzufügen",
+        "add_folder": "Ordner hinzufügen",
+        "remove_selected": "Auswahl entfernen",
+        "clear_list": "Liste leeren",
+        "include_sub": "Unterordner einbeziehen",
+        "method": "Methode",
+        "verify": "Verifizieren (Digest, alle Durchläufe)",
+        "sample": "Stichprobe % (0 = vollständig)",
+        "rename": "Vor Löschen umbenennen",
+        "rename_times": "Umbenennungen",
+        "jobs": "Jobs je Laufwerk",
+        "start": "Starten",
+        "cancel": "Abbrechen",
+        "pause": "Pause",
+        "resume": "Fortsetzen",
+        "limit_mbs": "Limit MB/s (0 = aus)",
+        "paused": "Pausiert",
+        "export": "Report exportieren (CSV/JSON)",
+        "github": "GitHub",
+        "info": "Info",
+        "lang": "DE/EN",
+        "files": "Ziele (Dateien/Ordner)",
+        "options": "Optionen",
+        "size": "Größe",
+        "status": "Status",
+        "progress": "Fortschritt",
+        "log": "Protokoll",
+        "log_detail": "Detailliertes Protokoll (je Durchlauf)",
+        "confirm": "Bist du sicher? Dieser Vorgang ist irreversibel.",
+        "planning": "Löschung wird geplant …",
+        "plan": "{targets} Ziele ({merged} zusammengeführt), {files} Dateien, {links} zusätzliche Hardlinks\n"
+                "{size} × {passes} Durchläufe = {total}",
+        "plan_outside": "{n} Hardlinks außerhalb der Ziele: Daten werden überschrieben, Namen bleiben erhalten.",
+        "plan_sparse": "Sparse-Dateien: {logical} logisch, {size} belegt",
+        "merged": "Zusammengeführt",
+        "done": "Fertig. Erfolgreich: {ok}, Fehler: {fail}",
+        "report_saved": "Report gespeichert: {p}",
+        "report_live": "Report wird laufend geschrieben: {p}",
+        "about_title": "Über diese Anwendung",
+        "about_text": (
+            f"{APP_NAME} {APP_VERSION}\nBYLICKILABS Edition\n\n"
+            "Sicheres Löschen von Dateien/Ordnern mittels Mehrfachüberschreibung.\n"
+            "Hinweis: SSDs bieten keine garantierte sichere Löschung.\n"
+            "Empfohlen: Vollverschlüsselung und hersteller-spezifische Secure-Erase-Verfahren.\n\n"
+            "© Thorsten Bylicki | © BYLICKILABS"
+        ),
+        "eta": "Restzeit ~ {mins}m",
+        "rate": "{done} / {total} · {mbs:.1f} MB/s",
+        "columns": {"path": "Pfad", "size": "Größe", "status": "Status"},
+        "methods": {
+            "ZERO": "Zero Fill (1 Pass)",
+            "RANDOM": "Random (1 Pass)",
+            "DOD3": "DoD 5220.22-M (3 Durchläufe)",
+            "NIST1": "NIST SP 800-88 (1 Durchlauf random)",
+            "GUTMANN": "Gutmann (35 Durchläufe)"
+        },
+        "started": "Löschung gestartet …",
+        "skipped_link": "Symlink übersprungen: {p}",
+        "error": "Fehler: {e}",
+        "deleted": "Gelöscht",
+        "pass_ok": "Pass {i}/{n} OK",
+        "renamed": "Umbenannt",
+        "ver_ok": "Verifiziert",
+    },
+    "en": {
+        "title": f"{APP_NAME} v{APP_VERSION} - {APP_AUTHOR}",
+        "add_files": "Add Files",
+        "add_folder": "Add Folder",
+        "remove_selected": "Remove Selected",
+        "clear_list": "Clear List",
+        "include_sub": "Include subfolders",
+        "method": "Method",
+        "verify": "Verify (digest, all passes)",
+        "sample": "Sample % (0 = full)",
+        "rename": "Rename before delete",
+        "rename_times": "Renames",
+        "jobs": "Jobs per device",
+        "start": "Start",
+        "cancel": "Cancel",
+        "pause": "Pause",
+        "resume": "Resume",
+        "limit_mbs": "Limit MB/s (0 = off)",
+        "paused": "Paused",
+        "export": "Export Report (CSV/JSON)",
+        "github": "GitHub",
+        "info": "Info",
+        "lang": "DE/EN",
+        "files": "Targets (files/folders)",
+        "options": "Options",
+        "size": "Size",
+        "status": "Status",
+        "progress": "Progress",
+        "log": "Log",
+        "log_detail": "Detailed log (per pass)",
+        "confirm": "Are you sure? This operation is irreversible.",
+        "planning": "Planning wipe …",
+        "plan": "{targets} targets ({merged} merged), {files} files, {links} extra hardlinks\n"
+                "{size} × {passes} passes = {total}",
+        "plan_outside": "{n} hardlinks outside the targets: data is overwritten, the names remain.",
+        "plan_sparse": "Sparse files: {logical} logical, {size} allocated",
+        "merged": "Merged",
+        "done": "Done. Success: {ok}, Failures: {fail}",
+        "report_saved": "Report saved: {p}",
+        "report_live": "Streaming report to: {p}",
+        "about_title": "About this App",
+        "about_text": (
+            f"{APP_NAME} {APP_VERSION}\nBYLICKILABS Edition\n\n"
+            "Secure deletion of files/folders via multi-pass overwrite.\n"
+            "Note: SSDs cannot guarantee secure erasure due to wear-leveling.\n"
+            "Prefer full-disk encryption and vendor secure erase where required.\n\n"
+            "© Thorsten Bylicki | © BYLICKILABS"
+        ),
+        "eta": "ETA ~ {mins}m",
+        "rate": "{done} / {total} · {mbs:.1f} MB/s",
+        "columns": {"path": "Path", "size": "Size", "status": "Status"},
+        "methods": {
+            "ZERO": "Zero Fill (1 Pass)",
+            "RANDOM": "Random (1 Pass)",
+            "DOD3": "DoD 5220.22-M (3 Passes)",
+            "NIST1": "NIST SP 800-88 (1 Pass Random)",
+            "GUTMANN": "Gutmann (35 Passes)"
+        },
+        "started": "Wipe started …",
+        "skipped_link": "Symlink skipped: {p}",
+        "error": "Error: {e}",
+        "deleted": "Deleted",
+        "pass_ok": "Pass {i}/{n} OK",
+        "renamed": "Renamed",
+        "ver_ok": "Verified",
+    }
+}
+
+class TargetStore:
+    def __init__(self):
+        self.items: List[TargetItem] = []
+        self.index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def add(self, item: TargetItem) -> Optional[int]:
+        if item.path in self.index:
+            return None
+        idx = self.index[item.path] = len(self.items)
+        self.items.append(item)
+        return idx
+
+    def remove(self, idxs: Set[int]):
+        self.items = [t for i, t in enumerate(self.items) if i not in idxs]
+        self.index = {t.path: i for i, t in enumerate(self.items)}
+
+    def clear(self):
+        self.items.clear()
+        self.index.clear()
+
+class App(tk.Tk):
+    EVENT_POLL_MS = 50
+    EVENT_BATCH = 500
+    STATUS_FLUSH_MS = 250
+    LOG_FLUSH_MS = 200
+    LOG_MAX_LINES = 2000
+    PAGE_SIZE = 500
+
+    def __init__(self):
+        super().__init__()
+        self.lang = "de"
+        self.targets = TargetStore()
+        self._page = 0
+        self._dirty: Set[int] = set()
+        self.include_sub = tk.BooleanVar(value=True)
+        self.verify_fixed = tk.BooleanVar(value=True)
+        self.rename_before = tk.BooleanVar(value=True)
+        self.rename_times = tk.IntVar(value=2)
+        self.jobs_per_device = tk.IntVar(value=1)
+        self.sample_pct = tk.DoubleVar(value=0.0)
+        self.limit_mbs = tk.DoubleVar(value=0.0)
+        self.limit_mbs.trace_add("write", lambda *_: self._on_limit_changed())
+        self._throttle = Throttle()
+        self.log_detail = tk.BooleanVar(value=False)
+        self._logs = LogPipeline("INFO", self.LOG_MAX_LINES)
+        self.method_code = WipeMethod.DOD3
+        self.method_label_var = tk.StringVar(value=self._method_label(self.method_code))
+        self.worker = None
+        self._shredder = None
+        self._events: "queue.Queue[tuple]" = queue.Queue()
+        self._scans: Dict[str, threading.Event] = {}
+        self._report_path: Optional[Path] = None
+
+        self.title(I18N[self.lang]["title"])
+        self.geometry("1180x760")
+        self.minsize(1100, 660)
+        self.style = ttk.Style(self)
+        try:
+            self.style.theme_use("clam")
+        except Exception:
+            pass
+        self._apply_light_theme()
+        self._build_ui()
+        self._i18n_apply()
+        self._update_pager()
+        self.after(self.EVENT_POLL_MS, self._drain_events)
+        self.after(self.STATUS_FLUSH_MS, self._flush_status)
+        self.after(self.LOG_FLUSH_MS, self._flush_log)
+
+    def _apply_light_theme(self):
+        bg = "#F8FAFC"; fg = "#0F172A"; entry_bg = "#FFFFFF"
+        self.configure(bg=bg)
+        self.style.configure("TFrame", background=bg)
+        self.style.configure("TLabel", background=bg, foreground=fg)
+        self.style.configure("TButton", foreground=fg)
+        self.style.configure("TCheckbutton", background=bg, foreground=fg)
+        self.style.configure("TLabelframe", background=bg, foreground=fg)
+        self.style.configure("TLabelframe.Label", background=bg, foreground=fg)
+        self.style.configure("Treeview", background=entry_bg, fieldbackground=entry_bg, foreground=fg)
+        self.style.configure("TEntry", fieldbackground=entry_bg)
+        self.style.configure("Horizontal.TProgressbar", troughcolor=entry_bg)
+
+    def _method_label(self, code: str) -> str:
+        return I18N[self.lang]["methods"][code]
+
+    def _method_code_from_label(self, label: str) -> str:
+        for k, v in I18N[self.lang]["methods"].items():
+            if v == label:
+                return k
+        return self.method_code
+
+    def _method_values(self) -> List[str]:
+        return [I18N[self.lang]["methods"][k] for k in WIPE_METHODS]
+
+    def _build_ui(self):
+        top = ttk.Frame(self); top.pack(fill="x", padx=12, pady=10)
+        self.lbl_title = ttk.Label(top, text=APP_NAME, font=("Segoe UI", 16, "bold"))
+        self.lbl_title.pack(side="left")
+        right = ttk.Frame(top); right.pack(side="right")
+        self.btn_github = ttk.Button(right, text=I18N[self.lang]["github"], command=self._open_github)
+        self.btn_info = ttk.Button(right, text=I18N[self.lang]["info"], command=self._show_info)
+        self.btn_lang = ttk.Button(right, text="EN", command=self._toggle_lang)
+        self.btn_github.grid(row=0, column=0, padx=4)
+        self.btn_info.grid(row=0, column=1, padx=4)
+        self.btn_lang.grid(row=0, column=2, padx=4)
+
+        self.cfg_frame = ttk.LabelFrame(self, text=I18N[self.lang]["files"]) ; self.cfg_frame.pack(fill="x", padx=12, pady=(0,10))
+        row = ttk.Frame(self.cfg_frame); row.pack(fill="x", padx=8, pady=8)
+        self.btn_add_files = ttk.Button(row, text=I18N[self.lang]["add_files"], command=self._add_files)
+        self.btn_add_folder = ttk.Button(row, text=I18N[self.lang]["add_folder"], command=self._add_folder)
+        self.btn_remove = ttk.Button(row, text=I18N[self.lang]["remove_selected"], command=self._remove_selected)
+        self.btn_clear = ttk.Button(row, text=I18N[self.lang]["clear_list"], command=self._clear_list)
+        self.chk_include = ttk.Checkbutton(row, text=I18N[self.lang]["include_sub"], variable=self.include_sub)
+        self.btn_add_files.pack(side="left", padx=4)
+        self.btn_add_folder.pack(side="left", padx=4)
+        self.btn_remove.pack(side="left", padx=4)
+        self.btn_clear.pack(side="left", padx=4)
+        self.chk_include.pack(side="left", padx=16)
+
+        cols = ("path", "size", "status")
+        self.tree = ttk.Treeview(self, columns=cols, show="headings", selectmode="extended")
+        self.tree.heading("path", text=I18N[self.lang]["columns"]["path"]) ; self.tree.column("path", width=720)
+        self.tree.heading("size", text=I18N[self.lang]["columns"]["size"]) ; self.tree.column("size", width=120, anchor="e")
+        self.tree.heading("status", text=I18N[self.lang]["columns"]["status"]) ; self.tree.column("status", width=160, anchor="center")
+        self.tree.pack(fill="both", expand=True, padx=12, pady=(0,4))
+        pager = ttk.Frame(self); pager.pack(fill="x", padx=12, pady=(0,10))
+        self.btn_next = ttk.Button(pager, text="▶", width=3, command=lambda: self._goto_page(self._page + 1))
+        self.btn_prev = ttk.Button(pager, text="◀", width=3, command=lambda: self._goto_page(self._page - 1))
+        self.lbl_page = ttk.Label(pager, text="")
+        self.btn_next.pack(side="right")
+        self.lbl_page.pack(side="right", padx=8)
+        self.btn_prev.pack(side="right")
+
+        self.opt_frame = ttk.LabelFrame(self, text=I18N[self.lang]["options"]) ; self.opt_frame.pack(fill="x", padx=12, pady=(0,10))
+        ttk.Label(self.opt_frame, text=I18N[self.lang]["method"]).grid(row=0, column=0, sticky="w")
+        self.cmb_method = ttk.Combobox(self.opt_frame, state="readonly", width=34, textvariable=self.method_label_var, values=self._method_values())
+        self.cmb_method.grid(row=0, column=1, padx=8, sticky="w")
+        self.cmb_method.bind("<<ComboboxSelected>>", self._on_method_changed)
+        self.chk_verify = ttk.Checkbutton(self.opt_frame, text=I18N[self.lang]["verify"], variable=self.verify_fixed)
+        self.chk_verify.grid(row=0, column=2, padx=16, sticky="w")
+        self.chk_detail = ttk.Checkbutton(self.opt_frame, text=I18N[self.lang]["log_detail"], variable=self.log_detail,
+                                          command=self._on_log_detail)
+        self.chk_detail.grid(row=1, column=2, padx=16, sticky="w")
+        self.chk_rename = ttk.Checkbutton(self.opt_frame, text=I18N[self.lang]["rename"], variable=self.rename_before)
+        self.chk_rename.grid(row=0, column=3, padx=16, sticky="w")
+        self.lbl_ren = ttk.Label(self.opt_frame, text=I18N[self.lang]["rename_times"]) ; self.lbl_ren.grid(row=0, column=4, padx=4, sticky="e")
+        self.spn_times = ttk.Spinbox(self.opt_frame, from_=0, to=10, width=5, textvariable=self.rename_times)
+        self.spn_times.grid(row=0, column=5, padx=4, sticky="w")
+        self.lbl_jobs = ttk.Label(self.opt_frame, text=I18N[self.lang]["jobs"]) ; self.lbl_jobs.grid(row=0, column=6, padx=(16,4), sticky="e")
+        self.spn_jobs = ttk.Spinbox(self.opt_frame, from_=1, to=16, width=5, textvariable=self.jobs_per_device)
+        self.spn_jobs.grid(row=0, column=7, padx=4, sticky="w")
+        self.lbl_sample = ttk.Label(self.opt_frame, text=I18N[self.lang]["sample"]) ; self.lbl_sample.grid(row=1, column=3, columnspan=2, padx=4, sticky="e")
+        self.spn_sample = ttk.Spinbox(self.opt_frame, from_=0, to=100, increment=1, width=5, textvariable=self.sample_pct)
+        self.spn_sample.grid(row=1, column=5, padx=4, sticky="w")
+        self.lbl_limit = ttk.Label(self.opt_frame, text=I18N[self.lang]["limit_mbs"]) ; self.lbl_limit.grid(row=1, column=6, padx=(16,4), sticky="e")
+        self.spn_limit = ttk.Spinbox(self.opt_frame, from_=0, to=10000, increment=10, width=7, textvariable=self.limit_mbs)
+        self.spn_limit.grid(row=1, column=7, padx=4, sticky="w")
+
+        act = ttk.Frame(self); act.pack(fill="x", padx=12, pady=(0,10))
+        self.btn_start = ttk.Button(act, text=I18N[self.lang]["start"], command=self._start)
+        self.btn_pause = ttk.Button(act, text=I18N[self.lang]["pause"], command=self._toggle_pause, state="disabled")
+        self.btn_cancel = ttk.Button(act, text=I18N[self.lang]["cancel"], command=self._cancel, state="disabled")
+        self.btn_export = ttk.Button(act, text=I18N[self.lang]["export"], command=self._export_report)
+        self.btn_start.pack(side="left", padx=4)
+        self.btn_pause.pack(side="left", padx=4)
+        self.btn_cancel.pack(side="left", padx=4)
+        self.btn_export.pack(side="left", padx=4)
+
+        prog = ttk.LabelFrame(self, text=I18N[self.lang]["progress"]) ; prog.pack(fill="x", padx=12, pady=(0,10))
+        self.pbar = ttk.Progressbar(prog, mode="determinate", maximum=100)
+        self.pbar.pack(fill="x", padx=8, pady=8)
+        self.lbl_eta = ttk.Label(prog, text="")
+        self.lbl_eta.pack(anchor="e", padx=8, pady=(0,8))
+
+        self.log_frame = ttk.LabelFrame(self, text=I18N[self.lang]["log"]) ; self.log_frame.pack(fill="both", expand=True, padx=12, pady=(0,12))
+        self.txt_log = tk.Text(self.log_frame, height=10, wrap="word", state="disabled")
+        self.txt_log.pack(fill="both", expand=True)
+
+    def _i18n(self, key):
+        return I18N[self.lang][key]
+
+    def _i18n_apply(self):
+        self.title(self._i18n("title"))
+        
+        self.btn_github.config(text=self._i18n("github"))
+        self.btn_info.config(text=self._i18n("info"))
+        self.btn_lang.config(text=("EN" if self.lang == "de" else "DE"))
+
+        self.cfg_frame.config(text=self._i18n("files"))
+        self.opt_frame.config(text=self._i18n("options"))
+        self.log_frame.config(text=self._i18n("log"))
+
+        self.tree.heading("path", text=I18N[self.lang]["columns"]["path"]) ;
+        self.tree.heading("size", text=I18N[self.lang]["columns"]["size"]) ;
+        self.tree.heading("status", text=I18N[self.lang]["columns"]["status"]) ;
+
+        self.btn_add_files.config(text=self._i18n("add_files"))
+        self.btn_add_folder.config(text=self._i18n("add_folder"))
+        self.btn_remove.config(text=self._i18n("remove_selected"))
+        self.btn_clear.config(text=self._i18n("clear_list"))
+        self.chk_include.config(text=self._i18n("include_sub"))
+
+        current_code = self.method_code
+        self.cmb_method.config(values=self._method_values())
+        self.method_label_var.set(self._method_label(current_code))
+        self.chk_verify.config(text=self._i18n("verify"))
+        self.chk_detail.config(text=self._i18n("log_detail"))
+        self.chk_rename.config(text=self._i18n("rename"))
+        self.lbl_ren.config(text=self._i18n("rename_times"))
+        self.lbl_jobs.config(text=self._i18n("jobs"))
+        self.lbl_limit.config(text=self._i18n("limit_mbs"))
+        self.lbl_sample.config(text=self._i18n("sample"))
+        self.btn_start.config(text=self._i18n("start"))
+        self.btn_pause.config(text=self._i18n("resume" if self._throttle.paused else "pause"))
+        self.btn_cancel.config(text=self._i18n("cancel"))
+        self.btn_export.config(text=self._i18n("export"))
+
+    def _toggle_lang(self):
+        self.lang = "en" if self.lang == "de" else "de"
+        self._i18n_apply()
+
+    def _on_method_changed(self, _evt):
+        label = self.method_label_var.get()
+        self.method_code = self._method_code_from_label(label)
+
+    def _open_github(self):
+        import webbrowser
+        webbrowser.open(GITHUB_URL)
+
+    def _show_info(self):
+        messagebox.showinfo(self._i18n("about_title"), self._i18n("about_text"))
+
+    def _add_files(self):
+        paths = filedialog.askopenfilenames(title=self._i18n("add_files"))
+        if not paths: return
+        for p in paths:
+            self._add_path(Path(p))
+
+    def _add_folder(self):
+        d = filedialog.askdirectory(title=self._i18n("add_folder"))
+        if not d: return
+        self._add_path(Path(d), recursive=self.include_sub.get())
+
+    def _add_path(self, p: Path, recursive: bool = True):
+        try:
+            is_dir = p.is_dir() and not p.is_symlink()
+            size = 0 if is_dir else p.lstat().st_size
+            item = TargetItem(str(p), size, "PENDING", is_dir, recursive)
+            idx = self.targets.add(item)
+            if idx is None:
+                return
+            if is_dir:
+                stop = self._scans[item.path] = threading.Event()
+                threading.Thread(target=self._scan_folder, args=(item, stop), name="shred-scan", daemon=True).start()
+            start, end = self._page_range()
+            if start <= idx < end:
+                self.tree.insert("", "end", iid=str(idx), values=self._row_values(item))
+            self._update_pager()
+        except Exception as e:
+            self._log(f"[ERR] add {p}: {e}")
+
+    def _scan_folder(self, item: TargetItem, stop: threading.Event):
+        total = 0; files = 0
+        last = time.time()
+        for entry in iter_files(Path(item.path), item.recursive):
+            if stop.is_set():
+                return
+            try:
+                total += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+            files += 1
+            if time.time() - last >= 0.25:
+                self._events.put(("size", item, total, files, False))
+                last = time.time()
+        self._events.put(("size", item, total, files, True))
+
+    def _on_scan_update(self, item: TargetItem, total: int, files: int, done: bool):
+        item.size = total
+        if done:
+            self._scans.pop(item.path, None)
+        idx = self.targets.index.get(item.path)
+        if idx is not None:
+            self._dirty.add(idx)
+
+    def _row_values(self, item: TargetItem) -> tuple:
+        size = human_size(item.size) + (" …" if item.path in self._scans else "")
+        return (item.path, size, item.status)
+
+    def _page_range(self):
+        start = self._page * self.PAGE_SIZE
+        return start, min(start + self.PAGE_SIZE, len(self.targets))
+
+    def _goto_page(self, page: int):
+        last = max(0, (len(self.targets) - 1) // self.PAGE_SIZE)
+        self._page = min(max(0, page), last)
+        self.tree.delete(*self.tree.get_children())
+        start, end = self._page_range()
+        for idx in range(start, end):
+            self.tree.insert("", "end", iid=str(idx), values=self._row_values(self.targets.items[idx]))
+        self._update_pager()
+
+    def _update_pager(self):
+        start, end = self._page_range()
+        n = len(self.targets)
+        self.lbl_page.config(text=f"{start + 1 if n else 0}–{end} / {n}")
+        self.btn_prev.config(state="normal" if self._page > 0 else "disabled")
+        self.btn_next.config(state="normal" if end < n else "disabled")
+
+    def _flush_status(self):
+        if self._dirty:
+            start, end = self._page_range()
+            for idx in self._dirty:
+                if start <= idx < end and self.tree.exists(str(idx)):
+                    self.tree.item(str(idx), values=self._row_values(self.targets.items[idx]))
+            self._dirty.clear()
+        self.after(self.STATUS_FLUSH_MS, self._flush_status)
+
+    def _remove_selected(self):
+        if self.worker is not None: return
+        sel = self.tree.selection()
+        if not sel: return
+        idxs = {int(iid) for iid in sel}
+        for idx in idxs:
+            stop = self._scans.pop(self.targets.items[idx].path, None)
+            if stop is not None: stop.set()
+        self.targets.remove(idxs)
+        self._goto_page(self._page)
+
+    def _clear_list(self):
+        if self.worker is not None: return
+        for stop in self._scans.values():
+            stop.set()
+        self._scans.clear()
+        self.targets.clear()
+        self._goto_page(0)
+
+    def _start(self):
+        if not self.targets or self.worker is not None:
+            return
+        self.btn_start.config(state="disabled")
+        self._log(f"[INFO] {self._i18n('planning')}")
+        items = list(self.targets.items)
+        targets = [(idx, Path(t.path), t.recursive) for idx, t in enumerate(items)]
+        self.worker = threading.Thread(target=lambda: self._events.put(("plan", build_plan(targets), items)),
+                                       name="shred-plan", daemon=True)
+        self.worker.start()
+
+    def _on_plan(self, plan: WipePlan, items: List[TargetItem]):
+        self.worker = None
+        passes = len(method_passes(self.method_code))
+        summary = self._i18n("plan").format(targets=len(plan.roots), merged=len(plan.merged),
+                                            files=plan.unique_files, links=plan.extra_links,
+                                            size=human_size(plan.unique_bytes), passes=passes,
+                                            total=human_size(plan.cost(passes)))
+        if plan.logical_bytes != plan.unique_bytes:
+            summary += "\n" + self._i18n("plan_sparse").format(logical=human_size(plan.logical_bytes),
+                                                              size=human_size(plan.unique_bytes))
+        if plan.outside_links:
+            summary += "\n" + self._i18n("plan_outside").format(n=plan.outside_links)
+        for line in summary.splitlines():
+            self._log(f"[PLAN] {line}")
+        if not messagebox.askyesno(APP_NAME, summary + "\n\n" + self._i18n("confirm")):
+            self.btn_start.config(state="normal")
+            return
+        try:
+            self._report_path = new_report_path()
+            report = ReportWriter.open(self._report_path)
+        except OSError as e:
+            messagebox.showerror(APP_NAME, str(e))
+            self.btn_start.config(state="normal")
+            return
+        self.btn_cancel.config(state="normal")
+        self.btn_pause.config(state="normal", text=self._i18n("pause"))
+        self.pbar["value"] = 0
+        self._log(f"[INFO] {self._i18n('started')}")
+        self._log(f"[INFO] {self._i18n('report_live').format(p=self._report_path)}")
+        opts = (report, self.method_code, self.verify_fixed.get(),
+                self.rename_times.get() if self.rename_before.get() else 0, max(1, self.jobs_per_device.get()))
+        progress = Progress(callback=lambda info: self._events.put(("progress", info)))
+        self._throttle.resume()
+        self._shredder = Shredder(self._logs, progress=progress, chunk_policy=ChunkPolicy(CHUNK_SIZE, log=self._logs),
+                                  throttle=self._throttle, verifier=self._verifier())
+        self.worker = threading.Thread(target=self._run_worker, args=(self._shredder, plan, items) + opts,
+                                       name="shred-worker", daemon=True)
+        self.worker.start()
+
+    def _cancel(self):
+        if self._shredder is not None:
+            self._shredder.cancel()
+
+    def _toggle_pause(self):
+        if self._throttle.paused:
+            self._throttle.resume()
+            self.btn_pause.config(text=self._i18n("pause"))
+        else:
+            self._throttle.pause()
+            self.btn_pause.config(text=self._i18n("resume"))
+            self.lbl_eta.config(text=self._i18n("paused"))
+
+    def _verifier(self) -> Verifier:
+        try:
+            pct = float(self.sample_pct.get())
+        except (tk.TclError, ValueError):
+            pct = 0.0
+        return Verifier("sampled", pct / 100) if 0 < pct < 100 else Verifier()
+
+    def _on_limit_changed(self):
+        try:
+            mbs = float(self.limit_mbs.get())
+        except (tk.TclError, ValueError):
+            return
+        self._throttle.set_limits(mbs)
+
+    def _run_worker(self, shred: Shredder, plan: WipePlan, targets: List[TargetItem], report: ReportWriter,
+                    method: str, verify: bool, renames: int, per_device: int) -> Tuple[int, int]:
+        ok = fail = 0
+        try:
+            ok, fail = self._run_jobs(shred, plan, targets, report, method, verify, renames, per_device)
+        finally:
+            report.close()
+            self._events.put(("done", ok, fail))
+
+    def _run_jobs(self, shred: Shredder, plan: WipePlan, targets: List[TargetItem], report: ReportWriter,
+                  method: str, verify: bool, renames: int, per_device: int) -> Tuple[int, int]:
+        post = self._events.put
+        shred.progress.add_total(plan.cost(len(shred._method_passes(method))))
+        ok = 0; fail = 0
+        kinds = {}
+        failed = set()
+        for idx, _ in plan.merged:
+            post(("status", idx, self._i18n("merged")))
+
+        def jobs():
+            for root in plan.roots:
+                idx = root.tag
+                if root.missing:
+                    kinds[idx] = "missing"
+                    yield idx, None
+                else:
+                    kinds[idx] = ("dir" if root.recursive else "flat") if root.is_dir else "file"
+                    yield from plan.root_jobs(root)
+
+        sched = WipeScheduler(shred, method, verify, renames, per_device=per_device)
+        for idx, rr in sched.run(jobs()):
+            if rr is not None:
+                report.write(rr)
+                self._log_row(rr)
+                if kinds[idx] != "file":
+                    if rr.result not in OK_RESULTS:
+                        failed.add(idx)
+                    continue
+                post(("status", idx, rr.result))
+                if rr.result in OK_RESULTS:
+                    ok += 1
+                else:
+                    fail += 1
+            elif kinds[idx] == "missing":
+                p = targets[idx].path
+                post(("status", idx, "MISSING"))
+                report.write(ReportRow(p, method, 0, 0, 0, "NO", 0.0, "MISSING", ""))
+            elif kinds[idx] == "flat":
+                post(("status", idx, "PARTIAL" if idx in failed else self._i18n("deleted")))
+                ok += idx not in failed
+            elif remove_empty_dirs(Path(targets[idx].path)):
+                post(("status", idx, self._i18n("deleted")))
+                ok += 1
+            else:
+                post(("status", idx, "PARTIAL"))
+
+        shred.progress.flush()
+        return ok, fail
+
+    def _drain_events(self):
+        try:
+            for _ in range(self.EVENT_BATCH):
+                ev = self._events.get_nowait()
+                kind = ev[0]
+                if kind == "status":
+                    self._update_status(ev[1], ev[2])
+                elif kind == "progress":
+                    self._on_progress(ev[1])
+                elif kind == "size":
+                    self._on_scan_update(*ev[1:])
+                elif kind == "plan":
+                    self._on_plan(ev[1], ev[2])
+                elif kind == "done":
+                    self._on_worker_done(ev[1], ev[2])
+        except queue.Empty:
+            pass
+        self.after(self.EVENT_POLL_MS, self._drain_events)
+
+    def _on_progress(self, info: ProgressInfo):
+        self.pbar["value"] = info.fraction * 100
+        text = self._i18n("rate").format(done=human_size(info.done), total=human_size(info.total),
+                                         mbs=info.rate / (1024 * 1024))
+        mins = int(info.eta_sec // 60) if info.eta_sec is not None else 0
+        if mins > 0:
+            text = self._i18n("eta").format(mins=mins) + "  ·  " + text
+        self.lbl_eta.config(text=text)
+
+    def _on_worker_done(self, ok: int, fail: int):
+        msg = self._i18n("done").format(ok=ok, fail=fail)
+        self._log(f"[INFO] {msg}")
+        self.worker = None
+        self._shredder = None
+        self._throttle.resume()
+        self.btn_start.config(state="normal")
+        self.btn_cancel.config(state="disabled")
+        self.btn_pause.config(state="disabled", text=self._i18n("pause"))
+
+    def _export_report(self):
+        if self._report_path is None or self.worker is not None or not self._report_path.exists():
+            return
+        path = filedialog.asksaveasfilename(title="Export report", defaultextension=".csv",
+            filetypes=[("CSV","*.csv"),("JSON","*.json")], initialfile="data_shredder_report.csv")
+        if not path:
+            return
+        p = Path(path)
+        try:
+            export_report(self._report_path, p)
+            messagebox.showinfo(APP_NAME, self._i18n("report_saved").format(p=p))
+        except Exception as e:
+            messagebox.showerror(APP_NAME, str(e))
+
+    def _log(self, msg: str):
+        self._logs(msg)
+
+    def _flush_log(self):
+        lines, dropped = self._logs.drain()
+        if lines:
+            if dropped:
+                lines.insert(0, f"[INFO] … {dropped}")
+            self.txt_log.configure(state="normal")
+            self.txt_log.insert("end", "\n".join(lines) + "\n")
+            excess = int(self.txt_log.index("end-1c").split(".")[0]) - 1 - self.LOG_MAX_LINES
+            if excess > 0:
+                self.txt_log.delete("1.0", f"{excess + 1}.0")
+            self.txt_log.see("end")
+            self.txt_log.configure(state="disabled")
+        self.after(self.LOG_FLUSH_MS, self._flush_log)
+
+    def _on_log_detail(self):
+        self._logs.level = "DEBUG" if self.log_detail.get() else "INFO"
+
+    def _log_row(self, rr: ReportRow):
+        if rr.result == "DELETED":
+            self._log(f"[OK] {rr.path} ({human_size(rr.size)}) in {rr.duration_sec:.2f}s")
+        elif rr.result == "ERROR":
+            self._log(f"[ERR] {rr.path}: {rr.error}")
+        else:
+            self._log(f"[INFO] {rr.path}: {rr.result}")
+
+    def _update_status(self, idx: int, text: str):
+        if 0 <= idx < len(self.targets):
+            self.targets.items[idx].status = text
+            self._dirty.add(idx)
+
+def main():
+    app = App()
+    app.mainloop()
@@ -0,0 +1,160 @@
+import os
+import re
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+
+JOB_DIR = Path.home() / ".datashredder" / "jobs"
+JOB_SETTINGS = ("method", "verify", "verify_mode", "verify_coverage", "renames", "jobs_per_device", "random",
+                "prefetch", "pipeline", "durability", "group_files", "chunk", "io", "offload", "free_space",
+                "fill_workers", "fill_reserve")
+
+_JOB_NAME = re.compile(r"^[A-Za-z0-9._-]+$")
+
+class Journal:
+    def __init__(self, path: Path):
+        self.path = path
+        self._state: Dict[str, dict] = {}
+        self._renamed: Dict[str, str] = {}
+        self._finished: Set[str] = set()
+        self._lock = threading.Lock()
+        if path.exists():
+            self._replay()
+        self._f = open(path, "a", encoding="utf-8")
+
+    def _entry(self, p: str) -> dict:
+        e = self._state.get(p)
+        if e is None:
+            e = self._state[p] = {"orig": p, "pass": 0, "off": 0, "renames": 0}
+        return e
+
+    def _replay(self):
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                kind, p = rec.get("t"), rec.get("p")
+                if kind == "pass":
+                    e = self._entry(p)
+                    e["pass"] = rec["i"]; e["off"] = 0
+                elif kind == "off":
+                    e = self._entry(p)
+                    e["pass"] = rec["i"] - 1; e["off"] = rec["off"]
+                elif kind == "ren":
+                    e = self._state.pop(p, None) or {"orig": p, "pass": 0, "off": 0, "renames": 0}
+                    e["renames"] += 1
+                    self._state[rec["to"]] = e
+                    self._renamed[e["orig"]] = rec["to"]
+                elif kind == "done":
+                    e = self._state.pop(p, None)
+                    orig = e["orig"] if e is not None else p
+                    self._renamed.pop(orig, None)
+                    self._finished.add(orig)
+                elif kind == "target":
+                    self._finished.add(p)
+
+    def lookup(self, p: Path) -> Tuple[int, int, int]:
+        with self._lock:
+            e = self._state.get(str(p))
+        if e is None:
+            return 0, 0, 0
+        return e["pass"], e["off"], e["renames"]
+
+    def finished(self, p: Path) -> bool:
+        return any(str(a) in self._finished for a in (p, *p.parents))
+
+    def current_path(self, p: Path) -> Path:
+        cur = self._renamed.get(str(p))
+        return Path(cur) if cur else p
+
+    def _append(self, rec: dict):
+        line = json.dumps(rec, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._f.write(line)
+            self._f.flush()
+
+    def pass_done(self, p: Path, i: int):
+        self._append({"t": "pass", "p": str(p), "i": i})
+
+    def offset(self, p: Path, i: int, off: int):
+        self._append({"t": "off", "p": str(p), "i": i, "off": off})
+
+    def renamed(self, p: Path, new: Path):
+        self._append({"t": "ren", "p": str(p), "to": str(new)})
+
+    def done(self, p: Path, result: str):
+        self._append({"t": "done", "p": str(p), "r": result})
+
+    def target_done(self, p: Path):
+        self._append({"t": "target", "p": str(p)})
+
+    def close(self):
+        with self._lock:
+            self._f.flush()
+            os.fsync(self._f.fileno())
+            self._f.close()
+
+class Job:
+    def __init__(self, name: str):
+        if not _JOB_NAME.match(name):
+            raise ValueError(f"Invalid job name: {name}")
+        self.name = name
+        self.dir = JOB_DIR / name
+        self.settings: dict = {}
+        self.finished = False
+
+    @classmethod
+    def create(cls, name: str, settings: dict) -> "Job":
+        job = cls(name)
+        job.dir.mkdir(parents=True, exist_ok=False)
+        job.settings = {k: settings[k] for k in JOB_SETTINGS}
+        job._save()
+        return job
+
+    @classmethod
+    def open(cls, name: str) -> "Job":
+        job = cls(name)
+        with open(job.dir / "job.json", encoding="utf-8") as f:
+            data = json.load(f)
+        job.settings = data["settings"]
+        job.finished = data.get("finished", False)
+        return job
+
+    def _save(self):
+        tmp = self.dir / "job.json.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"name": self.name, "settings": self.settings, "finished": self.finished}, f, indent=2)
+            f.flush(); os.fsync(f.fileno())
+        os.replace(tmp, self.dir / "job.json")
+
+    def mark_finished(self):
+        self.finished = True
+        self._save()
+
+    def journal(self) -> Journal:
+        return Journal(self.dir / "journal.jsonl")
+
+    def add_targets(self, targets: Iterable[Path]) -> int:
+        n = 0
+        with open(self.dir / "targets.txt", "a", encoding="utf-8") as f:
+            for p in targets:
+                f.write(f"{os.path.abspath(p)}\n")
+                n += 1
+            f.flush(); os.fsync(f.fileno())
+        return n
+
+    def targets(self, journal: Optional[Journal] = None) -> Iterator[Path]:
+        with open(self.dir / "targets.txt", encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if not line:
+                    continue
+                p = Path(line)
+                if journal is not None:
+                    if journal.finished(p):
+                        continue
+                    p = journal.current_path(p)
+                yield p
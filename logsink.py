@@ -0,0 +1,100 @@
+import json
+import time
+import queue
+import threading
+from collections import deque
+from typing import Callable, List, Optional, Tuple
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
+
+_TAG_LEVELS = {
+    "PASS": "DEBUG", "VER": "DEBUG", "RENAME": "DEBUG",
+    "INFO": "INFO", "OK": "INFO",
+    "WARN": "WARN",
+    "ERR": "ERROR",
+}
+
+def level_of(msg: str) -> str:
+    if msg.startswith("["):
+        end = msg.find("]")
+        if end > 0:
+            return _TAG_LEVELS.get(msg[1:end], "INFO")
+    return "INFO"
+
+class JsonlSink:
+    def __init__(self, path: str, flush_sec: float = 1.0, max_pending: int = 100_000):
+        self.path = path
+        self.flush_sec = flush_sec
+        self.dropped = 0
+        self._q: "queue.Queue[Optional[Tuple[float, str, str]]]" = queue.Queue(maxsize=max_pending)
+        self._f = open(path, "a", encoding="utf-8", buffering=1024 * 1024)
+        self._thread = threading.Thread(target=self._run, name="shred-logsink", daemon=True)
+        self._thread.start()
+
+    def write(self, ts: float, level: str, msg: str):
+        try:
+            self._q.put_nowait((ts, level, msg))
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        last_flush = time.time()
+        while True:
+            try:
+                item = self._q.get(timeout=self.flush_sec)
+            except queue.Empty:
+                item = ()
+            if item is None:
+                break
+            if item:
+                ts, level, msg = item
+                self._f.write(json.dumps({"ts": round(ts, 3), "level": level, "msg": msg}, ensure_ascii=False) + "\n")
+            if time.time() - last_flush >= self.flush_sec:
+                self._f.flush()
+                last_flush = time.time()
+        if self.dropped:
+            self._f.write(json.dumps({"ts": round(time.time(), 3), "level": "WARN",
+                                      "msg": f"[WARN] {self.dropped} log lines dropped"}) + "\n")
+        self._f.close()
+
+    def close(self):
+        self._q.put(None)
+        self._thread.join()
+
+class LogPipeline:
+    def __init__(self, level: str = "INFO", max_lines: int = 2000, sink: Optional[JsonlSink] = None,
+                 echo: Optional[Callable[[str], None]] = None):
+        self.level = level
+        self.max_lines = max_lines
+        self.sink = sink
+        self.echo = echo
+        self.dropped = 0
+        self._pending: deque = deque()
+        self._lock = threading.Lock()
+
+    def __call__(self, msg: str):
+        level = level_of(msg)
+        if LEVELS[level] < LEVELS[self.level]:
+            return
+        if self.sink is not None:
+            self.sink.write(time.time(), level, msg)
+        if self.echo is not None:
+            self.echo(msg)
+        if self.max_lines > 0:
+            with self._lock:
+                if len(self._pending) >= self.max_lines:
+                    self._pending.popleft()
+                    self.dropped += 1
+                self._pending.append(msg)
+
+    def drain(self) -> Tuple[List[str], int]:
+        with self._lock:
+            lines = list(self._pending)
+            dropped = self.dropped
+            self._pending.clear()
+            self.dropped = 0
+        return lines, dropped
+
+    def close(self):
+        if self.sink is not None:
+            self.sink.close()
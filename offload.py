@@ -0,0 +1,128 @@
+import os
+import errno
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Set, Tuple
+
+OFFLOAD_MODES = ("none", "auto", "copy_file_range", "sendfile")
+
+_FALLBACK_ERRNOS = {errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF}
+
+def _available(backend: str) -> bool:
+    return hasattr(os, backend)
+
+class _Source:
+    __slots__ = ("fd", "refs", "evicted")
+
+    def __init__(self, fd: int):
+        self.fd = fd
+        self.refs = 0
+        self.evicted = False
+
+def _pattern_fd(byte_val: int, length: int) -> int:
+    if hasattr(os, "memfd_create"):
+        fd = os.memfd_create(f"shred-pattern-{byte_val:02x}")
+    else:
+        fd, path = tempfile.mkstemp(prefix="shred-pattern-")
+        os.unlink(path)
+    try:
+        data = bytes([byte_val]) * length
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+class Offload:
+    def __init__(self, mode: str = "auto", max_sources: int = 4):
+        if mode not in OFFLOAD_MODES:
+            raise ValueError(f"Unknown offload mode: {mode}")
+        if mode == "auto":
+            wanted: Tuple[str, ...] = ("copy_file_range", "sendfile")
+        elif mode == "none":
+            wanted = ()
+        else:
+            wanted = (mode,)
+        self.backends: List[str] = [b for b in wanted if _available(b)]
+        if not hasattr(os, "memfd_create") and "copy_file_range" in self.backends:
+            self.backends.remove("copy_file_range")
+        self.max_sources = max_sources
+        self._sources: "OrderedDict[Tuple[int, int], _Source]" = OrderedDict()
+        self._broken: Set[Tuple[str, int]] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.backends)
+
+    def _acquire(self, byte_val: int, length: int) -> _Source:
+        key = (byte_val, length)
+        with self._lock:
+            src = self._sources.get(key)
+            if src is not None:
+                self._sources.move_to_end(key)
+                src.refs += 1
+                return src
+        src = _Source(_pattern_fd(byte_val, length))
+        with self._lock:
+            old = self._sources.get(key)
+            if old is not None:
+                os.close(src.fd)
+                src = old
+            else:
+                self._sources[key] = src
+                while len(self._sources) > self.max_sources:
+                    _, ev = self._sources.popitem(last=False)
+                    ev.evicted = True
+                    if ev.refs == 0:
+                        os.close(ev.fd)
+            src.refs += 1
+        return src
+
+    def _release(self, src: _Source):
+        with self._lock:
+            src.refs -= 1
+            if src.evicted and src.refs == 0:
+                os.close(src.fd)
+
+    def write(self, fd: int, dev: int, off: int, length: int, byte_val: int, chunk_size: int,
+              advance: Callable[[int], None], gate: Callable[[int], None]) -> Optional[str]:
+        for backend in self.backends:
+            if (backend, dev) in self._broken:
+                continue
+            src = self._acquire(byte_val, chunk_size)
+            done = 0
+            try:
+                if backend == "sendfile":
+                    os.lseek(fd, off, os.SEEK_SET)
+                while done < length:
+                    n = min(chunk_size, length - done)
+                    gate(n)
+                    if backend == "copy_file_range":
+                        w = os.copy_file_range(src.fd, fd, n, 0, off + done)
+                    else:
+                        w = os.sendfile(fd, src.fd, 0, n)
+                    if w <= 0:
+                        raise IOError("Short write")
+                    done += w
+                    advance(w)
+                return backend
+            except OSError as e:
+                if done or e.errno not in _FALLBACK_ERRNOS:
+                    raise
+                with self._lock:
+                    self._broken.add((backend, dev))
+            finally:
+                self._release(src)
+        return None
+
+    def close(self):
+        with self._lock:
+            for src in self._sources.values():
+                src.evicted = True
+                if src.refs == 0:
+                    os.close(src.fd)
+            self._sources.clear()
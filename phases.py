@@ -0,0 +1,146 @@
+import sys
+import time
+import pstats
+import cProfile
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+PHASES = ("generate", "write", "fsync", "verify", "rename", "unlink")
+
+HIST_BUCKETS = 32
+
+@dataclass
+class PhaseTimes:
+    sec: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    nbytes: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(PHASES, 0))
+    fsync_ms: List[float] = field(default_factory=list)
+
+    def add(self, phase: str, t0: float, n: int = 0) -> float:
+        now = time.perf_counter()
+        self.sec[phase] += now - t0
+        self.nbytes[phase] += n
+        return now
+
+    def sync(self, t0: float):
+        self.share_sync(time.perf_counter() - t0)
+
+    def share_sync(self, sec: float):
+        self.sec["fsync"] += sec
+        self.fsync_ms.append(sec * 1000)
+
+    def apply(self, row):
+        row.t_generate = self.sec["generate"]
+        row.t_write = self.sec["write"]
+        row.t_fsync = self.sec["fsync"]
+        row.t_verify = self.sec["verify"]
+        row.t_rename = self.sec["rename"]
+        row.t_unlink = self.sec["unlink"]
+        row.bytes_generated = self.nbytes["generate"]
+        row.bytes_written = self.nbytes["write"]
+        row.bytes_verified = self.nbytes["verify"]
+        row.fsync_ms = ";".join(f"{ms:.2f}" for ms in self.fsync_ms)
+        return row
+
+def _bucket(sec: float) -> int:
+    return min(HIST_BUCKETS - 1, max(0, int(sec * 1_000_000)).bit_length())
+
+class RunTimings:
+    def __init__(self):
+        self.files = 0
+        self.sec = dict.fromkeys(PHASES, 0.0)
+        self.nbytes = dict.fromkeys(PHASES, 0)
+        self.hist = {p: [0] * HIST_BUCKETS for p in PHASES + ("fsync_pass",)}
+        self._lock = threading.Lock()
+
+    def add(self, ph: PhaseTimes):
+        with self._lock:
+            self.files += 1
+            for p in PHASES:
+                self.sec[p] += ph.sec[p]
+                self.nbytes[p] += ph.nbytes[p]
+                if ph.sec[p] > 0:
+                    self.hist[p][_bucket(ph.sec[p])] += 1
+            for ms in ph.fsync_ms:
+                self.hist["fsync_pass"][_bucket(ms / 1000)] += 1
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "files": self.files,
+                "phases": {p: {"sec": round(self.sec[p], 6), "bytes": self.nbytes[p]} for p in PHASES},
+                "histograms_us_log2": {p: {f"<{1 << i}": c for i, c in enumerate(h) if c} for p, h in self.hist.items()},
+            }
+
+    def lines(self) -> List[str]:
+        s = self.summary()
+        out = [f"[INFO] timings for {s['files']} files"]
+        for p, v in s["phases"].items():
+            mbs = v["bytes"] / v["sec"] / (1024 * 1024) if v["sec"] > 0 and v["bytes"] else 0.0
+            hist = " ".join(f"{k}us:{c}" for k, c in s["histograms_us_log2"][p].items())
+            out.append(f"[INFO]   {p:<8} {v['sec']:10.3f}s {v['bytes']:>14} B {mbs:9.1f} MB/s  {hist}")
+        hist = " ".join(f"{k}us:{c}" for k, c in s["histograms_us_log2"]["fsync_pass"].items())
+        out.append(f"[INFO]   fsync per pass  {hist}")
+        return out
+
+class ThreadProfiles:
+    def __init__(self, log=None):
+        self.log = log
+        self.shared = sys.version_info >= (3, 12)
+        self._profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+        self._off = False
+
+    def run(self, fn, *args):
+        if self.shared:
+            self._start_shared()
+            return fn(*args)
+        prof = cProfile.Profile()
+        if not self._enable(prof):
+            return fn(*args)
+        with self._lock:
+            self._profiles.append(prof)
+        try:
+            return fn(*args)
+        finally:
+            prof.disable()
+
+    def _start_shared(self):
+        with self._lock:
+            if self._profiles or self._off:
+                return
+            prof = cProfile.Profile()
+            if self._enable(prof):
+                self._profiles.append(prof)
+
+    def _enable(self, prof: cProfile.Profile) -> bool:
+        if self._off:
+            return False
+        try:
+            prof.enable()
+            return True
+        except ValueError as e:
+            self._off = True
+            if self.log is not None:
+                self.log(f"[WARN] profiling disabled: {e}")
+            return False
+
+    def dump(self, path: str) -> bool:
+        with self._lock:
+            profiles = list(self._profiles)
+        if self.shared:
+            for prof in profiles:
+                prof.disable()
+        stats = None
+        for prof in profiles:
+            try:
+                if stats is None:
+                    stats = pstats.Stats(prof)
+                else:
+                    stats.add(prof)
+            except TypeError:
+                continue
+        if stats is None:
+            return False
+        stats.dump_stats(path)
+        return True
@@ -0,0 +1,191 @@
+import os
+import stat
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from shredder import human_size
+from smallfiles import DirBatch, iter_files, iter_tree_jobs
+
+@dataclass(slots=True)
+class LinkOnly:
+    path: Path
+
+@dataclass
+class PlanRoot:
+    tag: Any
+    path: Path
+    is_dir: bool = False
+    recursive: bool = True
+    missing: bool = False
+    real: Optional[Path] = None
+    files: int = 0
+    size: int = 0
+
+Job = Union[Path, DirBatch, LinkOnly, None]
+
+@dataclass
+class WipePlan:
+    roots: List[PlanRoot] = field(default_factory=list)
+    merged: List[Tuple[Any, Any]] = field(default_factory=list)
+    files: int = 0
+    unique_files: int = 0
+    unique_bytes: int = 0
+    logical_bytes: int = 0
+    extra_links: int = 0
+    outside_links: int = 0
+    symlinks: int = 0
+    _claimed: Set[Tuple[int, int]] = field(default_factory=set, repr=False)
+
+    def cost(self, passes: int) -> int:
+        return self.unique_bytes * passes
+
+    def lines(self, passes: int) -> List[str]:
+        out = [f"[PLAN] {len(self.roots)} targets ({len(self.merged)} merged), {self.files} files, "
+               f"{self.unique_files} unique, {self.extra_links} extra hardlinks, {self.symlinks} symlinks",
+               f"[PLAN] {human_size(self.unique_bytes)} × {passes} passes = {human_size(self.cost(passes))} to write"]
+        if self.logical_bytes != self.unique_bytes:
+            out.append(f"[PLAN] sparse files: {human_size(self.logical_bytes)} logical, "
+                       f"{human_size(self.unique_bytes)} allocated")
+        if self.outside_links:
+            out.append(f"[WARN] {self.outside_links} hardlinks point into the targets from outside; "
+                       f"their data is wiped but the names stay")
+        return out
+
+    def jobs(self) -> Iterator[Tuple[Any, Job]]:
+        for root in self.roots:
+            yield from self.root_jobs(root)
+
+    def root_jobs(self, root: PlanRoot) -> Iterator[Tuple[Any, Job]]:
+        tag = root.tag
+        if not root.is_dir:
+            yield tag, self._dedupe(root.path)
+            return
+        for job in iter_tree_jobs(root.path, recursive=root.recursive):
+            if isinstance(job, DirBatch):
+                keep = []
+                links = []
+                for entry in job.entries:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        keep.append(entry)
+                        continue
+                    if self._claim(st):
+                        keep.append(entry)
+                    else:
+                        links.append(LinkOnly(Path(entry.path)))
+                job.entries = keep
+                if keep:
+                    yield tag, job
+                for link in links:
+                    yield tag, link
+            else:
+                yield tag, self._dedupe(job)
+        yield tag, None
+
+    def _dedupe(self, p: Path) -> Union[Path, LinkOnly]:
+        try:
+            st = os.lstat(p)
+        except OSError:
+            return p
+        return p if self._claim(st) else LinkOnly(p)
+
+    def _claim(self, st: os.stat_result) -> bool:
+        if not stat.S_ISREG(st.st_mode):
+            return True
+        key = (st.st_dev, st.st_ino)
+        if key in self._claimed:
+            return False
+        if st.st_nlink > 1:
+            self._claimed.add(key)
+        return True
+
+def allocated_bytes(st: os.stat_result) -> int:
+    blocks = getattr(st, "st_blocks", None)
+    return st.st_size if blocks is None else min(st.st_size, blocks * 512)
+
+def _covering(root: PlanRoot, dirs: Dict[Path, PlanRoot]) -> Optional[PlanRoot]:
+    for depth, parent in enumerate(root.real.parents):
+        d = dirs.get(parent)
+        if d is not None and (d.recursive or (depth == 0 and not root.is_dir)):
+            return d
+    return None
+
+def _stats(root: PlanRoot) -> Iterator[os.stat_result]:
+    if root.missing:
+        return
+    if not root.is_dir:
+        try:
+            yield os.lstat(root.path)
+        except OSError:
+            pass
+        return
+    for entry in iter_files(root.path, root.recursive):
+        try:
+            yield entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+
+def build_plan(targets: Iterable[Tuple[Any, Path, bool]]) -> WipePlan:
+    plan = WipePlan()
+    by_path: Dict[str, PlanRoot] = {}
+    by_inode: Dict[Tuple[int, int], PlanRoot] = {}
+    roots: List[PlanRoot] = []
+    for tag, p, recursive in targets:
+        p = Path(os.path.abspath(p))
+        first = by_path.get(str(p))
+        if first is not None:
+            first.recursive = first.recursive or recursive
+            plan.merged.append((tag, first.tag))
+            continue
+        try:
+            st = os.lstat(p)
+        except OSError:
+            root = PlanRoot(tag, p, recursive=recursive, missing=True,
+                            real=Path(os.path.realpath(p.parent)) / p.name)
+        else:
+            is_dir = stat.S_ISDIR(st.st_mode)
+            real = Path(os.path.realpath(p)) if is_dir else Path(os.path.realpath(p.parent)) / p.name
+            root = PlanRoot(tag, p, is_dir, recursive, real=real)
+            if is_dir:
+                first = by_inode.get((st.st_dev, st.st_ino))
+                if first is not None:
+                    first.recursive = first.recursive or recursive
+                    plan.merged.append((tag, first.tag))
+                    continue
+                by_inode[(st.st_dev, st.st_ino)] = root
+        by_path[str(p)] = root
+        roots.append(root)
+
+    dirs = {r.real: r for r in roots if r.is_dir}
+    for root in roots:
+        cover = _covering(root, dirs) if root.real is not None else None
+        if cover is not None:
+            plan.merged.append((root.tag, cover.tag))
+        else:
+            plan.roots.append(root)
+
+    links: Dict[Tuple[int, int], List[int]] = {}
+    for root in plan.roots:
+        for st in _stats(root):
+            plan.files += 1
+            if stat.S_ISLNK(st.st_mode):
+                plan.symlinks += 1
+                continue
+            if st.st_nlink > 1:
+                key = (st.st_dev, st.st_ino)
+                seen = links.get(key)
+                if seen is not None:
+                    seen[1] += 1
+                    plan.extra_links += 1
+                    continue
+                links[key] = [st.st_nlink, 1]
+            plan.unique_files += 1
+            size = allocated_bytes(st)
+            plan.unique_bytes += size
+            plan.logical_bytes += st.st_size
+            root.files += 1
+            root.size += size
+    plan.outside_links = sum(max(0, nlink - found) for nlink, found in links.values())
+    return plan
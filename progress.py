@@ -0,0 +1,73 @@
+import time
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+@dataclass(slots=True)
+class ProgressInfo:
+    done: int
+    total: int
+    rate: float
+    eta_sec: Optional[float]
+
+    @property
+    def fraction(self) -> float:
+        if self.total <= 0:
+            return 1.0 if self.done else 0.0
+        return min(1.0, self.done / self.total)
+
+class Progress:
+    def __init__(self, total: int = 0, callback: Optional[Callable[[ProgressInfo], None]] = None,
+                 interval: float = 0.25, alpha: float = 0.3):
+        self.total = total
+        self.done = 0
+        self.rate = 0.0
+        self.callback = callback
+        self.interval = interval
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._last_t = time.monotonic()
+        self._last_done = 0
+
+    def add_total(self, n: int):
+        with self._lock:
+            self.total += n
+
+    def advance(self, n: int):
+        info = None
+        with self._lock:
+            self.done += n
+            now = time.monotonic()
+            dt = now - self._last_t
+            if dt >= self.interval:
+                self._sample(now, dt)
+                info = self._info()
+        if info is not None and self.callback is not None:
+            self.callback(info)
+
+    def credit(self, n: int):
+        if n <= 0:
+            return
+        with self._lock:
+            self.done += n
+            self._last_done += n
+
+    def _sample(self, now: float, dt: float):
+        inst = (self.done - self._last_done) / dt
+        self.rate = inst if self.rate == 0.0 else self.alpha * inst + (1 - self.alpha) * self.rate
+        self._last_t = now
+        self._last_done = self.done
+
+    def _info(self) -> ProgressInfo:
+        remaining = max(0, self.total - self.done)
+        eta = remaining / self.rate if self.rate > 0 else None
+        return ProgressInfo(self.done, self.total, self.rate, eta)
+
+    def snapshot(self) -> ProgressInfo:
+        with self._lock:
+            return self._info()
+
+    def flush(self):
+        info = self.snapshot()
+        if self.callback is not None:
+            self.callback(info)
@@ -0,0 +1,173 @@
+import os
+import abc
+import queue
+import hashlib
+import threading
+from typing import Optional, Union
+
+Buffer = Union[bytes, memoryview]
+
+RANDOM_SOURCES = ("urandom", "keystream")
+
+KEYSTREAM_PIECE = 64 * 1024
+
+_urandom_lock = threading.Lock()
+_urandom_fd = -2
+
+def _urandom() -> int:
+    global _urandom_fd
+    with _urandom_lock:
+        if _urandom_fd == -2:
+            try:
+                _urandom_fd = os.open("/dev/urandom", os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+            except (OSError, AttributeError):
+                _urandom_fd = -1
+        return _urandom_fd
+
+class RandomSource:
+    name = "urandom"
+
+    def read(self, n: int) -> Buffer:
+        return os.urandom(n)
+
+    def readinto(self, buf: memoryview):
+        fd = _urandom() if hasattr(os, "readv") else -1
+        if fd < 0:
+            buf[:] = os.urandom(len(buf))
+            return
+        pos = 0
+        while pos < len(buf):
+            n = os.readv(fd, [buf[pos:]])
+            if n <= 0:
+                raise IOError("Short read from /dev/urandom")
+            pos += n
+
+    def close(self):
+        pass
+
+class _BlockSource(RandomSource, abc.ABC):
+    def __init__(self, block_size: int):
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._block = memoryview(b"")
+        self._pos = 0
+
+    @abc.abstractmethod
+    def _next_block(self, n: int) -> Buffer:
+        ...
+
+    def _fill(self, buf: memoryview):
+        buf[:] = self._next_block(len(buf))
+
+    def read(self, n: int) -> Buffer:
+        if n >= self.block_size:
+            return self._next_block(n)
+        with self._lock:
+            if self._pos + n > len(self._block):
+                self._block = memoryview(self._next_block(self.block_size))
+                self._pos = 0
+            out = self._block[self._pos:self._pos + n]
+            self._pos += n
+        return out
+
+    def readinto(self, buf: memoryview):
+        if len(buf) >= self.block_size:
+            self._fill(buf)
+        else:
+            buf[:] = self.read(len(buf))
+
+class KeystreamSource(_BlockSource):
+    name = "keystream"
+
+    def __init__(self, block_size: int = 1024 * 1024, piece: int = KEYSTREAM_PIECE):
+        super().__init__(block_size)
+        self.piece = piece
+        self._base = hashlib.shake_128(b"datashredder-keystream" + os.urandom(32))
+        self._ctr = 0
+        self._ctr_lock = threading.Lock()
+
+    def _next_block(self, n: int) -> Buffer:
+        out = memoryview(bytearray(n))
+        self._fill(out)
+        return out
+
+    def _fill(self, buf: memoryview):
+        n, piece = len(buf), self.piece
+        with self._ctr_lock:
+            ctr = self._ctr
+            self._ctr += -(-n // piece)
+        for off in range(0, n, piece):
+            h = self._base.copy()
+            h.update(ctr.to_bytes(16, "little"))
+            end = min(off + piece, n)
+            buf[off:end] = h.digest(end - off)
+            ctr += 1
+
+class PrefetchSource(RandomSource):
+    def __init__(self, inner: RandomSource, block_size: int = 8 * 1024 * 1024, depth: int = 2):
+        self.inner = inner
+        self.block_size = block_size
+        self.name = f"{inner.name}+prefetch"
+        self._lock = threading.Lock()
+        self._q: "queue.Queue[Optional[memoryview]]" = queue.Queue()
+        self._free: "queue.Queue[memoryview]" = queue.Queue()
+        for _ in range(max(1, depth) + 1):
+            self._free.put(memoryview(bytearray(block_size)))
+        self._cur: Optional[memoryview] = None
+        self._pos = 0
+        self._error: Optional[BaseException] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, name="shred-prefetch", daemon=True)
+        self._thread.start()
+
+    def _produce(self):
+        try:
+            while not self._stop.is_set():
+                try:
+                    block = self._free.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+                self.inner.readinto(block)
+                self._q.put(block)
+        except Exception as e:
+            self._error = e
+            self._q.put(None)
+
+    def read(self, n: int) -> Buffer:
+        out = memoryview(bytearray(n))
+        self.readinto(out)
+        return out
+
+    def readinto(self, buf: memoryview):
+        n, pos = len(buf), 0
+        with self._lock:
+            while pos < n:
+                if self._cur is None:
+                    block = self._q.get()
+                    if block is None:
+                        self._q.put(None)
+                        raise IOError(f"Random prefetch failed: {self._error}")
+                    self._cur, self._pos = block, 0
+                k = min(n - pos, len(self._cur) - self._pos)
+                buf[pos:pos + k] = self._cur[self._pos:self._pos + k]
+                pos += k
+                self._pos += k
+                if self._pos == len(self._cur):
+                    self._free.put(self._cur)
+                    self._cur = None
+
+    def close(self):
+        self._stop.set()
+        self.inner.close()
+
+def make_random_source(kind: str = "urandom", prefetch: int = 0,
+                       block_size: int = 8 * 1024 * 1024) -> RandomSource:
+    if kind == "urandom":
+        src: RandomSource = RandomSource()
+    elif kind == "keystream":
+        src = KeystreamSource()
+    else:
+        raise ValueError(f"Unknown random source: {kind}")
+    if prefetch > 0:
+        src = PrefetchSource(src, block_size, prefetch)
+    return src
@@ -0,0 +1,110 @@
+import os
+import csv
+import json
+import time
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+from shredder import REPORT_FIELDS, ReportRow, report_csv_row
+
+REPORT_DIR = Path.home() / ".datashredder" / "reports"
+REPORT_FORMATS = ("text", "csv", "jsonl")
+
+_ROW_TYPES = {f.name: f.type for f in fields(ReportRow)}
+
+def format_for(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix == ".txt":
+        return "text"
+    return "jsonl"
+
+def new_report_path() -> Path:
+    REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    return REPORT_DIR / time.strftime("report-%Y%m%d-%H%M%S.jsonl")
+
+class ReportWriter:
+    def __init__(self, out: IO[str], fmt: str = "jsonl", checkpoint_rows: int = 500, checkpoint_sec: float = 2.0,
+                 owns: bool = False, live: bool = False):
+        if fmt not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format: {fmt}")
+        self.out = out
+        self.fmt = fmt
+        self.checkpoint_rows = checkpoint_rows
+        self.checkpoint_sec = checkpoint_sec
+        self.rows = 0
+        self._owns = owns
+        self._live = live
+        self._since = 0
+        self._last = time.time()
+        self._csv = csv.writer(out) if fmt == "csv" else None
+        if self._csv is not None and self._at_start():
+            self._csv.writerow(REPORT_FIELDS)
+
+    @classmethod
+    def open(cls, path: Path, fmt: Optional[str] = None, **kw) -> "ReportWriter":
+        out = open(path, "a", encoding="utf-8", newline="", buffering=64 * 1024)
+        return cls(out, fmt or format_for(path), owns=True, **kw)
+
+    def _at_start(self) -> bool:
+        try:
+            return self.out.tell() == 0
+        except (OSError, ValueError):
+            return True
+
+    def write(self, r: ReportRow):
+        if self.fmt == "csv":
+            self._csv.writerow(report_csv_row(r))
+        elif self.fmt == "jsonl":
+            self.out.write(json.dumps(asdict(r), ensure_ascii=False) + "\n")
+        else:
+            self.out.write(f"{r.result:<12} {r.path}" + (f"  ({r.error})" if r.error else "") + "\n")
+        self.rows += 1
+        self._since += 1
+        if self._live:
+            self.out.flush()
+        if self._owns and (self._since >= self.checkpoint_rows or time.time() - self._last >= self.checkpoint_sec):
+            self.checkpoint()
+
+    def checkpoint(self):
+        self.out.flush()
+        if self._owns:
+            os.fsync(self.out.fileno())
+        self._since = 0
+        self._last = time.time()
+
+    def close(self):
+        self.checkpoint()
+        if self._owns:
+            self.out.close()
+
+def read_report(path: Path) -> Iterator[ReportRow]:
+    with open(path, encoding="utf-8", newline="") as f:
+        if format_for(path) == "csv":
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        for d in rows:
+            kw = {}
+            for k, v in d.items():
+                t = _ROW_TYPES.get(k)
+                if t is None:
+                    continue
+                kw[k] = int(v) if t is int else float(v) if t is float else v
+            yield ReportRow(**kw)
+
+def export_report(src: Path, dst: Path):
+    if dst.suffix.lower() == ".json":
+        with open(dst, "w", encoding="utf-8") as f:
+            f.write("[")
+            for i, r in enumerate(read_report(src)):
+                f.write(("," if i else "") + "\n  " + json.dumps(asdict(r), ensure_ascii=False))
+            f.write("\n]\n")
+    else:
+        with open(dst, "w", encoding="utf-8", newline="") as f:
+            w = ReportWriter(f, format_for(dst))
+            for r in read_report(src):
+                w.write(r)
+            w.close()
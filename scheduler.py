@@ -0,0 +1,158 @@
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from shredder import CHUNK_SIZE, PendingWipe, ReportRow, Shredder
+from smallfiles import DirBatch, SmallFileWiper
+from planner import LinkOnly
+
+_SKIPPED = object()
+
+def device_of(p: Union[Path, DirBatch, LinkOnly]) -> int:
+    if isinstance(p, (DirBatch, LinkOnly)):
+        p = p.path
+    try:
+        return os.lstat(p).st_dev
+    except OSError:
+        return -1
+
+class WipeScheduler:
+    def __init__(self, shred: Shredder, method: str, verify_fixed: bool, rename_times: int,
+                 per_device: int = 1, window: int = 256, chunk_size: int = CHUNK_SIZE):
+        self.shred = shred
+        self.method = method
+        self.verify_fixed = verify_fixed
+        self.rename_times = rename_times
+        self.per_device = max(1, per_device)
+        self.window = max(1, window)
+        self.chunk_size = chunk_size
+        self._lanes: Dict[int, queue.Queue] = {}
+        self._threads: List[threading.Thread] = []
+        self._results: Dict[int, Tuple[Any, Any]] = {}
+        self._cond = threading.Condition()
+        self._small = SmallFileWiper(shred)
+
+    def cancel(self):
+        self.shred.cancel()
+
+    def run(self, jobs: Iterable[Tuple[Any, Union[Path, DirBatch, LinkOnly, None]]]
+            ) -> Iterator[Tuple[Any, Optional[ReportRow]]]:
+        it = iter(jobs)
+        seq_in = seq_out = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and not self.shred.cancelled and seq_in - seq_out < self.window:
+                    try:
+                        tag, p = next(it)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if p is None:
+                        with self._cond:
+                            self._results[seq_in] = (tag, None)
+                    else:
+                        self._lane(device_of(p)).put((seq_in, tag, p))
+                    seq_in += 1
+                if seq_out == seq_in:
+                    break
+                with self._cond:
+                    while seq_out not in self._results:
+                        self._cond.wait()
+                    tag, rr = self._results.pop(seq_out)
+                seq_out += 1
+                if isinstance(rr, list):
+                    for r in rr:
+                        yield tag, r
+                elif rr is not _SKIPPED:
+                    yield tag, rr
+        finally:
+            if seq_out < seq_in:
+                self.shred.cancel()
+            self._shutdown()
+
+    def _lane(self, dev: int) -> queue.Queue:
+        q = self._lanes.get(dev)
+        if q is None:
+            q = self._lanes[dev] = queue.Queue()
+            prof = self.shred.profiler
+            for i in range(self.per_device):
+                target, args = (prof.run, (self._lane_worker, q)) if prof is not None else (self._lane_worker, (q,))
+                t = threading.Thread(target=target, args=args, name=f"shred-dev{dev}-{i}", daemon=True)
+                t.start()
+                self._threads.append(t)
+        return q
+
+    def _lane_worker(self, q: queue.Queue):
+        batched = self.shred.durability.batched
+        batch: List[Tuple[int, Any, PendingWipe]] = []
+        while True:
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                self._flush(batch)
+                item = q.get()
+            if item is None:
+                self._flush(batch)
+                return
+            seq, tag, p = item
+            try:
+                if self.shred.cancelled:
+                    self._post(seq, tag, _SKIPPED)
+                elif isinstance(p, DirBatch):
+                    self._post(seq, tag, self._small.wipe_batch(p, self.method, self.verify_fixed,
+                                                                self.rename_times))
+                elif isinstance(p, LinkOnly):
+                    self._post(seq, tag, self.shred.remove_link(p.path, self.method))
+                elif not batched:
+                    self._post(seq, tag, self.shred.wipe_file(p, self.method, self.verify_fixed, self.rename_times,
+                                                              self.chunk_size))
+                else:
+                    pending = self.shred.begin_wipe(p, self.method, self.verify_fixed, self.chunk_size)
+                    if isinstance(pending, ReportRow):
+                        self._post(seq, tag, pending)
+                    else:
+                        batch.append((seq, tag, pending))
+            except Exception as e:
+                self._post(seq, tag, self._error_rows(p, e))
+            if len(batch) >= self.shred.durability.group_files:
+                self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[int, Any, PendingWipe]]):
+        if not batch:
+            return
+        try:
+            self.shred.commit_batch([w for _, _, w in batch])
+        except Exception as e:
+            for _, _, w in batch:
+                w.error = w.error or f"Batch sync failed: {e}"
+        for seq, tag, w in batch:
+            try:
+                rr = self.shred.finish_wipe(w, self.rename_times)
+            except Exception as e:
+                rr = self._error_rows(w.path, e)
+            self._post(seq, tag, rr)
+        batch.clear()
+
+    def _error_rows(self, p: Union[Path, DirBatch, LinkOnly], e: Exception) -> Union[ReportRow, List[ReportRow]]:
+        if isinstance(p, DirBatch):
+            return [ReportRow(en.path, self.method, 0, 0, 0, "NO", 0.0, "ERROR", str(e)) for en in p.entries]
+        path = p.path if isinstance(p, LinkOnly) else p
+        return ReportRow(str(path), self.method, 0, 0, 0, "NO", 0.0, "ERROR", str(e))
+
+    def _post(self, seq: int, tag: Any, rr: Any):
+        with self._cond:
+            self._results[seq] = (tag, rr)
+            self._cond.notify_all()
+
+    def _shutdown(self):
+        for q in self._lanes.values():
+            for _ in range(self.per_device):
+                q.put(None)
+        for t in self._threads:
+            t.join()
+        self._lanes.clear()
+        self._threads.clear()
+        self._results.clear()
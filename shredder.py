@@ -0,0 +1,673 @@
+import os
+import stat
+import errno
+import time
+import queue
+import random
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, List, Optional, Tuple, Union
+
+from durability import Durability, fdatasync
+from journal import Journal
+from progress import Progress
+from phases import PhaseTimes, RunTimings, ThreadProfiles
+from chunking import ChunkPolicy
+from offload import Offload
+from throttle import Throttle
+from verify import Verifier
+from directio import ALIGN, FADVISE_SUPPORTED, aligned_buffer, drop_cache, open_direct, resolve_mode
+from random_source import RandomSource
+
+APP_NAME    = "Data Shredder"
+APP_AUTHOR  = "©Thorsten Bylicki | ©BYLICKILABS"
+APP_VERSION = "1.0.0"
+GITHUB_URL  = "https://github.com/bylickilabs"
+
+CHUNK_SIZE = 8 * 1024 * 1024
+CHECKPOINT_BYTES = 1024 * 1024 * 1024
+
+class WipeMethod:
+    ZERO = "ZERO"
+    RANDOM = "RANDOM"
+    DOD3 = "DOD3"
+    NIST1 = "NIST1"
+    GUTMANN = "GUTMANN"
+
+WIPE_METHODS = (WipeMethod.ZERO, WipeMethod.RANDOM, WipeMethod.DOD3, WipeMethod.NIST1, WipeMethod.GUTMANN)
+
+GUTMANN_SEQUENCE: List[Optional[int]] = [
+    None, None, None, None,
+    0x55, 0xAA, 0x92, 0x49, 0x24,
+    0x00, 0x11, 0x22, 0x33, 0x44, 0x55, 0x66, 0x77, 0x88, 0x99, 0xAA, 0xBB, 0xCC, 0xDD, 0xEE, 0xFF,
+    0x92, 0x49, 0x24, 0x6D, 0xB6, 0xDB,
+    None, None, None, None
+]
+
+@dataclass(slots=True)
+class TargetItem:
+    path: str
+    size: int
+    status: str = "PENDING"
+    is_dir: bool = False
+    recursive: bool = True
+
+@dataclass(slots=True)
+class ReportRow:
+    path: str
+    method: str
+    size: int
+    passes: int
+    renamed: int
+    verified: str
+    duration_sec: float
+    result: str
+    error: str = ""
+    durability: str = ""
+    allocated: int = 0
+    chunk: int = 0
+    io: str = ""
+    backend: str = ""
+    t_generate: float = 0.0
+    t_write: float = 0.0
+    t_fsync: float = 0.0
+    t_verify: float = 0.0
+    t_rename: float = 0.0
+    t_unlink: float = 0.0
+    bytes_generated: int = 0
+    bytes_written: int = 0
+    bytes_verified: int = 0
+    fsync_ms: str = ""
+
+@dataclass
+class PendingWipe:
+    path: Path
+    method: str
+    size: int
+    passes: int
+    verified: str
+    start: float
+    durability: str
+    f: Optional[BinaryIO] = None
+    error: str = ""
+    allocated: int = 0
+    renames_done: int = 0
+    phases: Optional[PhaseTimes] = None
+    chunk: int = 0
+    io: str = ""
+    backend: str = ""
+
+OK_RESULTS = ("DELETED", "LINK_REMOVED", "WIPED")
+
+REPORT_FIELDS = ["path", "method", "size", "passes", "renamed", "verified", "duration_sec", "result", "error",
+                 "durability", "allocated", "chunk", "io", "backend", "t_generate", "t_write", "t_fsync", "t_verify", "t_rename", "t_unlink",
+                 "bytes_generated", "bytes_written", "bytes_verified", "fsync_ms"]
+
+def report_csv_row(r: ReportRow) -> list:
+    return [r.path, r.method, r.size, r.passes, r.renamed, r.verified, f"{r.duration_sec:.3f}", r.result, r.error,
+            r.durability, r.allocated, r.chunk, r.io, r.backend, f"{r.t_generate:.6f}", f"{r.t_write:.6f}", f"{r.t_fsync:.6f}",
+            f"{r.t_verify:.6f}", f"{r.t_rename:.6f}", f"{r.t_unlink:.6f}", r.bytes_generated, r.bytes_written,
+            r.bytes_verified, r.fsync_ms]
+
+def method_passes(method: str) -> List[Optional[int]]:
+    if method == WipeMethod.ZERO:
+        return [0x00]
+    if method in (WipeMethod.RANDOM, WipeMethod.NIST1):
+        return [None]
+    if method == WipeMethod.DOD3:
+        return [0xFF, 0x00, None]
+    if method == WipeMethod.GUTMANN:
+        return GUTMANN_SEQUENCE
+    raise ValueError("Unknown method")
+
+def human_size(n: int) -> str:
+    units = ["B", "KB", "MB", "GB", "TB"]
+    f = float(n)
+    for u in units:
+        if f < 1024 or u == units[-1]:
+            return f"{f:.1f} {u}"
+        f /= 1024
+
+NAME_ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+def random_name(length: int = 12) -> str:
+    return "".join(random.choices(NAME_ALPHABET, k=length))
+
+def ensure_writeable(p: Path):
+    try:
+        mode = os.stat(p).st_mode
+        if not (mode & stat.S_IWRITE):
+            os.chmod(p, mode | stat.S_IWRITE)
+    except Exception:
+        pass
+
+def is_symlink(p: Path) -> bool:
+    try:
+        return p.is_symlink()
+    except Exception:
+        return False
+
+def remove_empty_dirs(base: Path) -> bool:
+    dirs = [str(base)]
+    i = 0
+    while i < len(dirs):
+        try:
+            with os.scandir(dirs[i]) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        i += 1
+    for d in reversed(dirs):
+        try:
+            os.rmdir(d)
+        except OSError:
+            pass
+    return not base.exists()
+
+def data_extents(fd: int, size: int) -> List[Tuple[int, int]]:
+    if size <= 0:
+        return []
+    seek_data = getattr(os, "SEEK_DATA", None)
+    seek_hole = getattr(os, "SEEK_HOLE", None)
+    if seek_data is None or seek_hole is None:
+        return [(0, size)]
+    extents: List[Tuple[int, int]] = []
+    pos = 0
+    try:
+        while pos < size:
+            try:
+                start = os.lseek(fd, pos, seek_data)
+            except OSError as e:
+                if e.errno == errno.ENXIO:
+                    break
+                raise
+            if start >= size:
+                break
+            end = min(os.lseek(fd, start, seek_hole), size)
+            extents.append((start, end - start))
+            pos = end
+    except OSError:
+        return [(0, size)]
+    finally:
+        os.lseek(fd, 0, os.SEEK_SET)
+    return extents
+
+def split_extents(extents: List[Tuple[int, int]], start: int, step: int) -> Iterator[Tuple[int, int]]:
+    for off, length in extents:
+        end = off + length
+        off = max(off, start)
+        while off < end:
+            n = min(step, end - off)
+            yield off, n
+            off += n
+
+class PatternCache:
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._bufs: "OrderedDict[Tuple[int, int], bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def buffer_len(size: int, chunk_size: int) -> int:
+        if size >= chunk_size:
+            return chunk_size
+        return max(4096, 1 << max(0, size - 1).bit_length())
+
+    def get(self, byte_val: int, length: int) -> bytes:
+        key = (byte_val, length)
+        with self._lock:
+            buf = self._bufs.get(key)
+            if buf is not None:
+                self._bufs.move_to_end(key)
+                return buf
+        buf = bytes([byte_val]) * length
+        with self._lock:
+            if key not in self._bufs:
+                self._bufs[key] = buf
+                self._bytes += length
+                while self._bytes > self.max_bytes and len(self._bufs) > 1:
+                    _, old = self._bufs.popitem(last=False)
+                    self._bytes -= len(old)
+        return buf
+
+class Shredder:
+    def __init__(self, log_fn: Callable[[str], None], random_source: Optional[RandomSource] = None,
+                 pipeline_depth: int = 2, durability: Optional[Durability] = None, journal: Optional[Journal] = None,
+                 progress: Optional[Progress] = None, timings: Optional[RunTimings] = None,
+                 profiler: Optional[ThreadProfiles] = None, chunk_policy: Optional[ChunkPolicy] = None,
+                 io_mode: str = "buffered", offload: Optional[Offload] = None, throttle: Optional[Throttle] = None,
+                 verifier: Optional[Verifier] = None):
+        self._cancel = False
+        self.log = log_fn
+        self.patterns = PatternCache()
+        self.random = random_source or RandomSource()
+        self.pipeline_depth = pipeline_depth
+        self.durability = durability or Durability()
+        self.journal = journal
+        self.progress = progress
+        self.timings = timings
+        self.profiler = profiler
+        self.chunk_policy = chunk_policy
+        self.io_mode = resolve_mode(io_mode)
+        self.offload = offload if offload is not None and offload.enabled else None
+        self.throttle = throttle or Throttle()
+        self.verifier = verifier or Verifier()
+        self._local = threading.local()
+
+    def cancel(self):
+        self._cancel = True
+        self.throttle.wake()
+
+    def pause(self):
+        self.throttle.pause()
+
+    def resume(self):
+        self.throttle.resume()
+
+    @property
+    def paused(self) -> bool:
+        return self.throttle.paused
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel
+
+    def wipe_file(self, p: Path, method: str, verify_fixed: bool, rename_times: int,
+                  chunk_size: int = CHUNK_SIZE, skip_passes: int = 0) -> ReportRow:
+        pending = self.begin_wipe(p, method, verify_fixed, chunk_size, skip_passes)
+        if isinstance(pending, ReportRow):
+            return pending
+        if self.durability.batched:
+            self.commit_batch([pending])
+        return self.finish_wipe(pending, rename_times)
+
+    def begin_wipe(self, p: Path, method: str, verify_fixed: bool, chunk_size: int = CHUNK_SIZE,
+                   skip_passes: int = 0) -> Union[PendingWipe, ReportRow]:
+        start = time.time()
+        size = 0
+        expected = 0
+        self._local.written = 0
+        ph = self._local.ph = PhaseTimes() if self.timings is not None else None
+        self._local.tap = None
+        io = self.io_mode
+        f = None
+        dfd = None
+        try:
+            if not p.exists():
+                return ReportRow(str(p), method, 0, 0, 0, "NO", 0.0, "MISSING", "File not found")
+            if is_symlink(p):
+                p.unlink()
+                if self.journal is not None:
+                    self.journal.done(p, "LINK_REMOVED")
+                return ReportRow(str(p), method, 0, 0, 0, "NO", 0.0, "LINK_REMOVED", "")
+
+            ensure_writeable(p)
+            st = p.stat()
+            size = st.st_size
+            if self.chunk_policy is not None:
+                chunk_size, how = self.chunk_policy.choose(p, st, self._gate)
+                self.log(f"[PASS] chunk {chunk_size // 1024} KB ({how}) for {p}")
+            passes = self._method_passes(method)
+
+            buf_len = PatternCache.buffer_len(size, chunk_size)
+            label = ""
+            f = open(p, "r+b", buffering=0)
+            if io == "direct":
+                dfd = open_direct(p)
+                if dfd is None:
+                    io = "fadvise" if FADVISE_SUPPORTED else "buffered"
+            extents = data_extents(f.fileno(), size)
+            allocated = sum(length for _, length in extents)
+            expected = allocated * max(0, len(passes) - skip_passes)
+            journal = self.journal if not self.durability.batched else None
+            done_passes, resume_off, renames_done = self.journal.lookup(p) if self.journal else (0, 0, 0)
+            if done_passes or resume_off:
+                self.log(f"[INFO] resuming {p} at pass {done_passes + 1}/{len(passes)}, offset {resume_off}")
+            if skip_passes > done_passes:
+                done_passes, resume_off = skip_passes, 0
+            step = CHECKPOINT_BYTES if journal is not None else max(size, 1)
+            offload = self.offload if dfd is None else None
+            backends: List[str] = []
+            for i, pattern in enumerate(passes, 1):
+                if i <= done_passes:
+                    continue
+                if self._cancel:
+                    raise RuntimeError("Cancelled")
+                pat = None if pattern is None else memoryview(self.patterns.get(pattern, buf_len))
+                start_off = resume_off if i == done_passes + 1 else 0
+                used = "direct" if dfd is not None else "write"
+                tap = self._local.tap = self.verifier.tap(extents, start_off) if verify_fixed else None
+                for off, length in split_extents(extents, start_off, step):
+                    seg_len, end = length, off + length
+                    if tap is not None:
+                        tap.seek(off)
+                    if dfd is not None and off % ALIGN == 0:
+                        off = self._write_direct(dfd, off, length, chunk_size, pattern)
+                        length = end - off
+                    elif offload is not None and pattern is not None:
+                        t0 = time.perf_counter()
+                        b = offload.write(f.fileno(), st.st_dev, off, length, pattern, chunk_size, self._advance,
+                                          self._gate)
+                        if b is not None:
+                            if ph is not None:
+                                t0 = ph.add("write", t0, length)
+                            if tap is not None:
+                                tap.update_fill(pat, length)
+                                if ph is not None:
+                                    ph.add("verify", t0)
+                            used = b
+                            length = 0
+                    if length:
+                        f.seek(off)
+                        if pattern is None and self.pipeline_depth > 1 and length > chunk_size:
+                            self._write_random_pipelined(f, length, chunk_size)
+                        else:
+                            self._write_pass(f, length, chunk_size, pat)
+                    if journal is not None and seg_len == step:
+                        t0 = time.perf_counter()
+                        fdatasync(f.fileno())
+                        if ph is not None:
+                            ph.add("fsync", t0)
+                        journal.offset(p, i, end)
+                f.flush()
+                t0 = time.perf_counter()
+                label = self.durability.sync_pass(f.fileno(), allocated)
+                if ph is not None:
+                    ph.sync(t0)
+                if io != "buffered":
+                    drop_cache(f.fileno())
+                if extents:
+                    backends.append(used)
+                self.log(f"[PASS] {i}/{len(passes)} done for {p} ({used})")
+
+                if tap is not None:
+                    t0 = time.perf_counter()
+                    if not tap.check(self._reader(f, dfd, chunk_size), self._read_piece(chunk_size, dfd)):
+                        raise IOError("Verification failed")
+                    if io != "buffered":
+                        drop_cache(f.fileno())
+                    if ph is not None:
+                        ph.add("verify", t0, tap.checked)
+                    self.log(f"[VER] pass {i} verified ({self.verifier.level})")
+                if journal is not None and i < len(passes):
+                    journal.pass_done(p, i)
+            t0 = time.perf_counter()
+            self.durability.sync_file(f.fileno(), label)
+            if ph is not None:
+                ph.add("fsync", t0)
+            if journal is not None and done_passes < len(passes):
+                journal.pass_done(p, len(passes))
+
+            level = self.verifier.level if verify_fixed else "N/A"
+            pending = PendingWipe(p, method, size, len(passes), level, start, label, f,
+                                  allocated=allocated, renames_done=renames_done, phases=ph, chunk=chunk_size, io=io,
+                                  backend=";".join(backends))
+            if not self.durability.batched:
+                f.close(); pending.f = None
+            return pending
+
+        except Exception as e:
+            if f is not None:
+                f.close()
+            dur = time.time() - start
+            return self._with_phases(ReportRow(str(p), method, size, 0, 0, "NO", dur, "ERROR", str(e),
+                                               chunk=chunk_size, io=io), ph)
+        finally:
+            self._local.tap = None
+            if dfd is not None:
+                os.close(dfd)
+            if self.progress is not None:
+                self.progress.credit(expected - self._local.written)
+
+    def commit_batch(self, batch: List[PendingWipe]):
+        open_files = [w for w in batch if w.f is not None]
+        try:
+            t0 = time.perf_counter()
+            label = self.durability.sync_batch([w.f.fileno() for w in open_files])
+            share = (time.perf_counter() - t0) / max(1, len(open_files))
+            for w in open_files:
+                w.durability = label
+                if w.phases is not None:
+                    w.phases.share_sync(share)
+                if self.journal is not None:
+                    self.journal.pass_done(w.path, w.passes)
+        except Exception as e:
+            for w in open_files:
+                w.error = f"Batch sync failed: {e}"
+        finally:
+            for w in open_files:
+                w.f.close(); w.f = None
+
+    def finish_wipe(self, w: PendingWipe, rename_times: int) -> ReportRow:
+        p = w.path
+        ph = w.phases
+        try:
+            if w.error:
+                raise IOError(w.error)
+            ren_ct = w.renames_done
+            t0 = time.perf_counter()
+            for _ in range(max(0, rename_times - ren_ct)):
+                if self._cancel:
+                    raise RuntimeError("Cancelled")
+                new_name = random_name(random.randint(8, 18))
+                new_path = p.with_name(new_name)
+                try:
+                    p.rename(new_path)
+                    if self.journal is not None:
+                        self.journal.renamed(p, new_path)
+                    p = new_path
+                    ren_ct += 1
+                    self.log(f"[RENAME] -> {p.name}")
+                except Exception as e:
+                    self.log(f"[WARN] rename failed: {e}")
+                    break
+            if ph is not None:
+                t0 = ph.add("rename", t0)
+
+            try:
+                p.unlink()
+            except PermissionError:
+                ensure_writeable(p)
+                p.unlink()
+            if ph is not None:
+                ph.add("unlink", t0)
+            if self.journal is not None:
+                self.journal.done(p, "DELETED")
+
+            dur = time.time() - w.start
+            return self._with_phases(ReportRow(str(p), w.method, w.size, w.passes, ren_ct, w.verified, dur, "DELETED",
+                                               "", w.durability, w.allocated, w.chunk, w.io, w.backend), ph)
+
+        except Exception as e:
+            dur = time.time() - w.start
+            return self._with_phases(ReportRow(str(p), w.method, w.size, 0, 0, "NO", dur, "ERROR", str(e), w.durability,
+                                               w.allocated, w.chunk, w.io, w.backend), ph)
+
+    def remove_link(self, p: Path, method: str) -> ReportRow:
+        start = time.time()
+        size = 0
+        try:
+            size = p.lstat().st_size
+            p.unlink()
+            if self.journal is not None:
+                self.journal.done(p, "LINK_REMOVED")
+            return ReportRow(str(p), method, size, 0, 0, "NO", time.time() - start, "LINK_REMOVED", "")
+        except Exception as e:
+            return ReportRow(str(p), method, size, 0, 0, "NO", time.time() - start, "ERROR", str(e))
+
+    def _with_phases(self, row: ReportRow, ph: Optional[PhaseTimes]) -> ReportRow:
+        if ph is not None:
+            ph.apply(row)
+            self.timings.add(ph)
+        return row
+
+    def _write_pass(self, f, size: int, chunk_size: int, pat: Optional[memoryview]):
+        ph = self._local.ph
+        rbuf = self._random_buf(chunk_size) if pat is None else None
+        remaining = size
+        while remaining > 0:
+            n = min(chunk_size, remaining)
+            self._gate(n)
+            t0 = time.perf_counter() if ph is not None else 0.0
+            if rbuf is not None:
+                buf = rbuf if n == len(rbuf) else rbuf[:n]
+                self.random.readinto(buf)
+                if ph is not None:
+                    t0 = ph.add("generate", t0, n)
+            else:
+                buf = pat if n == len(pat) else pat[:n]
+            written = f.write(buf)
+            if written != n:
+                raise IOError("Short write")
+            if ph is not None:
+                t0 = ph.add("write", t0, n)
+            self._digest(buf, ph, t0)
+            self._advance(n)
+            remaining -= n
+
+    def _digest(self, buf, ph: Optional[PhaseTimes], t0: float):
+        tap = self._local.tap
+        if tap is not None:
+            tap.update(buf)
+            if ph is not None:
+                ph.add("verify", t0)
+
+    def _gate(self, n: int):
+        if self._cancel or not self.throttle.wait(n, lambda: self._cancel):
+            raise RuntimeError("Cancelled")
+
+    def _advance(self, n: int):
+        self._local.written += n
+        if self.progress is not None:
+            self.progress.advance(n)
+
+    def _reused(self, name: str, n: int, alloc: Callable[[int], memoryview]) -> memoryview:
+        buf = getattr(self._local, name, None)
+        if buf is None or len(buf) < n:
+            buf = alloc(max(n, self.chunk_policy.max_chunk if self.chunk_policy is not None else 0))
+            setattr(self._local, name, buf)
+        return buf[:n]
+
+    def _direct_buf(self, chunk_size: int) -> memoryview:
+        return self._reused("dbuf", max(ALIGN, chunk_size - chunk_size % ALIGN), aligned_buffer)
+
+    def _write_direct(self, fd: int, off: int, length: int, chunk_size: int, pattern: Optional[int]) -> int:
+        ph = self._local.ph
+        buf = self._direct_buf(chunk_size)
+        if pattern is not None:
+            buf[:] = self.patterns.get(pattern, len(buf))
+        end = off + length - length % ALIGN
+        pos = off
+        while pos < end:
+            n = min(len(buf), end - pos)
+            self._gate(n)
+            t0 = time.perf_counter() if ph is not None else 0.0
+            if pattern is None:
+                self.random.readinto(buf[:n])
+                if ph is not None:
+                    t0 = ph.add("generate", t0, n)
+            if os.pwrite(fd, buf[:n], pos) != n:
+                raise IOError("Short write")
+            if ph is not None:
+                t0 = ph.add("write", t0, n)
+            self._digest(buf[:n], ph, t0)
+            self._advance(n)
+            pos += n
+        return end
+
+    def _random_buf(self, chunk_size: int) -> memoryview:
+        return self._reused("rbuf", chunk_size, lambda n: memoryview(bytearray(n)))
+
+    def _ring(self, chunk_size: int) -> List[memoryview]:
+        return [self._reused(f"ring{i}", chunk_size, lambda n: memoryview(bytearray(n)))
+                for i in range(self.pipeline_depth)]
+
+    def _write_random_pipelined(self, f, size: int, chunk_size: int):
+        ring = self._ring(chunk_size)
+        ph = self._local.ph
+        free: "queue.Queue[Optional[int]]" = queue.Queue()
+        full: "queue.Queue[object]" = queue.Queue()
+        for idx in range(len(ring)):
+            free.put(idx)
+
+        def produce():
+            try:
+                remaining = size
+                while remaining > 0 and not self._cancel:
+                    n = min(chunk_size, remaining)
+                    idx = free.get()
+                    if idx is None:
+                        return
+                    t0 = time.perf_counter() if ph is not None else 0.0
+                    self.random.readinto(ring[idx] if n == chunk_size else ring[idx][:n])
+                    if ph is not None:
+                        ph.add("generate", t0, n)
+                    full.put((idx, n))
+                    remaining -= n
+                full.put(None)
+            except BaseException as e:
+                full.put(e)
+
+        producer = threading.Thread(target=produce, name="shred-gen", daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = full.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                idx, n = item
+                self._gate(n)
+                t0 = time.perf_counter() if ph is not None else 0.0
+                view = ring[idx] if n == chunk_size else ring[idx][:n]
+                written = f.write(view)
+                if written != n:
+                    raise IOError("Short write")
+                if ph is not None:
+                    t0 = ph.add("write", t0, n)
+                self._digest(view, ph, t0)
+                self._advance(n)
+                free.put(idx)
+            if self._cancel:
+                raise RuntimeError("Cancelled")
+        finally:
+            free.put(None)
+            producer.join()
+
+    def _method_passes(self, method: str) -> List[Optional[int]]:
+        return method_passes(method)
+
+    def _verify_buf(self, n: int) -> memoryview:
+        buf = getattr(self._local, "vbuf", None)
+        if buf is None or len(buf) < n:
+            buf = self._local.vbuf = memoryview(bytearray(n))
+        return buf
+
+    def _read_piece(self, chunk_size: int, dfd: Optional[int] = None) -> int:
+        return len(self._direct_buf(chunk_size)) if dfd is not None else chunk_size
+
+    def _reader(self, f, dfd: Optional[int], chunk_size: int) -> Callable[[int, int], memoryview]:
+        buf = self._direct_buf(chunk_size) if dfd is not None else self._verify_buf(chunk_size)
+
+        def read(off: int, n: int) -> memoryview:
+            self._gate(n)
+            head = 0
+            if dfd is not None and off % ALIGN == 0:
+                head = n - n % ALIGN
+                if head and os.preadv(dfd, [buf[:head]], off) != head:
+                    raise IOError("Short read")
+            if head < n:
+                f.seek(off + head)
+                if f.readinto(buf[head:n]) != n - head:
+                    raise IOError("Short read")
+            return buf[:n]
+        return read
@@ -0,0 +1,264 @@
+import os
+import stat
+import time
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Generator, Iterator, List, Optional, Union
+
+from shredder import CHUNK_SIZE, PatternCache, ReportRow, Shredder, random_name
+from phases import PhaseTimes
+from durability import syncfs_supported
+
+SMALL_FILE_MAX = 1024 * 1024
+DIR_BATCH_SIZE = 512
+
+SUPPORTED = (all(fn in os.supports_dir_fd for fn in (os.open, os.rename, os.unlink, os.chmod))
+             and hasattr(os, "O_DIRECTORY") and hasattr(os, "pwrite") and hasattr(os, "preadv"))
+
+@dataclass
+class DirBatch:
+    path: Path
+    entries: List[os.DirEntry] = field(default_factory=list)
+
+@dataclass
+class _Item:
+    name: str
+    size: int
+    elapsed: float
+    durability: str = ""
+    chunk: int = 0
+    renamed: int = 0
+    phases: Optional[PhaseTimes] = None
+
+def iter_files(base: Path, recursive: bool = True) -> Iterator[os.DirEntry]:
+    stack = [str(base)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                        else:
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+def iter_tree_jobs(base: Path, small_max: int = SMALL_FILE_MAX, batch_size: int = DIR_BATCH_SIZE,
+                   recursive: bool = True) -> Iterator[Union[Path, DirBatch]]:
+    if not SUPPORTED:
+        for entry in iter_files(base, recursive):
+            yield Path(entry.path)
+        return
+    subdirs: List[str] = []
+    batch = yield from _scan_dir(base, small_max, batch_size, recursive, subdirs)
+    if batch is None:
+        return
+    stack = [(batch, iter(subdirs))]
+    while stack:
+        batch, pending = stack[-1]
+        d = next(pending, None)
+        if d is None:
+            stack.pop()
+            if batch.entries:
+                yield batch
+            continue
+        subdirs = []
+        child = yield from _scan_dir(Path(d), small_max, batch_size, recursive, subdirs)
+        if child is not None:
+            stack.append((child, iter(subdirs)))
+
+def _scan_dir(d: Path, small_max: int, batch_size: int, recursive: bool,
+              subdirs: List[str]) -> Generator[Union[Path, DirBatch], None, Optional[DirBatch]]:
+    batch = DirBatch(d)
+    try:
+        with os.scandir(d) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            subdirs.append(entry.path)
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    yield Path(entry.path)
+                    continue
+                if stat.S_ISREG(st.st_mode) and st.st_size <= small_max:
+                    batch.entries.append(entry)
+                    if len(batch.entries) >= batch_size:
+                        yield batch
+                        batch = DirBatch(d)
+                else:
+                    yield Path(entry.path)
+    except OSError:
+        return None
+    return batch
+
+class SmallFileWiper:
+    def __init__(self, shred: Shredder):
+        self.shred = shred
+
+    def wipe_batch(self, batch: DirBatch, method: str, verify_fixed: bool, rename_times: int) -> List[ReportRow]:
+        shred = self.shred
+        rows: List[ReportRow] = []
+        try:
+            dfd = os.open(batch.path, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError as e:
+            return [ReportRow(en.path, method, 0, 0, 0, "NO", 0.0, "ERROR", str(e)) for en in batch.entries]
+        try:
+            passes = shred._method_passes(method)
+            done: List[_Item] = []
+            for entry in batch.entries:
+                if shred.cancelled:
+                    break
+                t0 = time.time()
+                size = chunk = 0
+                ph = PhaseTimes() if shred.timings is not None else None
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                    size = st.st_size
+                    chunk = PatternCache.buffer_len(size, CHUNK_SIZE)
+                    if stat.S_ISLNK(st.st_mode):
+                        os.unlink(entry.name, dir_fd=dfd)
+                        rows.append(ReportRow(entry.path, method, 0, 0, 0, "NO", 0.0, "LINK_REMOVED", ""))
+                        continue
+                    if not (st.st_mode & stat.S_IWRITE):
+                        os.chmod(entry.name, st.st_mode | stat.S_IWRITE, dir_fd=dfd)
+                    label = self._overwrite(dfd, entry.name, size, passes, verify_fixed, ph)
+                    done.append(_Item(entry.name, size, time.time() - t0, label, chunk, phases=ph))
+                except Exception as e:
+                    rows.append(shred._with_phases(ReportRow(entry.path, method, size, 0, 0, "NO", time.time() - t0,
+                                                             "ERROR", str(e), chunk=chunk, io="buffered"), ph))
+
+            if done and shred.durability.batched:
+                t1 = time.perf_counter()
+                try:
+                    label = shred.durability.sync_batch([dfd])
+                except OSError as e:
+                    rows.extend(self._failed(batch, done, method, e))
+                    done = []
+                else:
+                    sync_share = (time.perf_counter() - t1) / len(done)
+                    for it in done:
+                        it.durability = label
+                        if it.phases is not None:
+                            it.phases.share_sync(sync_share)
+
+            t0 = time.time()
+            for _ in range(max(0, rename_times)):
+                if shred.cancelled:
+                    break
+                for it in done:
+                    new_name = random_name(random.randint(8, 18))
+                    try:
+                        os.rename(it.name, new_name, src_dir_fd=dfd, dst_dir_fd=dfd)
+                        it.name = new_name
+                        it.renamed += 1
+                    except OSError as e:
+                        shred.log(f"[WARN] rename failed: {e}")
+            if rename_times > 0 and done:
+                try:
+                    os.fsync(dfd)
+                except OSError as e:
+                    rows.extend(self._failed(batch, done, method, e))
+                    done = []
+                else:
+                    shred.log(f"[RENAME] {len(done)} files x{rename_times} in {batch.path}")
+            share = (time.time() - t0) / len(done) if done else 0.0
+
+            for it in done:
+                t1 = time.time()
+                if it.phases is not None:
+                    it.phases.sec["rename"] += share
+                path = str(batch.path / it.name)
+                try:
+                    if shred.cancelled:
+                        raise RuntimeError("Cancelled")
+                    p0 = time.perf_counter()
+                    os.unlink(it.name, dir_fd=dfd)
+                    if it.phases is not None:
+                        it.phases.add("unlink", p0)
+                    rows.append(shred._with_phases(ReportRow(path, method, it.size, len(passes), it.renamed,
+                                                             shred.verifier.level if verify_fixed else "N/A",
+                                                             it.elapsed + share + time.time() - t1,
+                                                             "DELETED", "", it.durability, it.size, it.chunk,
+                                                             "buffered"), it.phases))
+                except Exception as e:
+                    rows.append(shred._with_phases(ReportRow(path, method, it.size, 0, it.renamed, "NO",
+                                                             it.elapsed + share, "ERROR", str(e), it.durability,
+                                                             it.size, it.chunk, "buffered"), it.phases))
+        finally:
+            os.close(dfd)
+        return rows
+
+    def _failed(self, batch: DirBatch, items: List[_Item], method: str, e: Exception) -> List[ReportRow]:
+        return [self.shred._with_phases(ReportRow(str(batch.path / it.name), method, it.size, 0, it.renamed, "NO",
+                                                  it.elapsed, "ERROR", str(e), it.durability, it.size, it.chunk,
+                                                  "buffered"), it.phases)
+                for it in items]
+
+    def _overwrite(self, dfd: int, name: str, size: int, passes: List[Optional[int]], verify_fixed: bool,
+                   ph: Optional[PhaseTimes] = None) -> str:
+        shred = self.shred
+        label = ""
+        written = 0
+        fd = os.open(name, os.O_RDWR | getattr(os, "O_NOFOLLOW", 0), dir_fd=dfd)
+        try:
+            buf_len = PatternCache.buffer_len(size, CHUNK_SIZE)
+            vbuf = shred._verify_buf(size) if verify_fixed else None
+
+            def read(off: int, n: int) -> memoryview:
+                if os.preadv(fd, [vbuf[off:off + n]], off) != n:
+                    raise IOError("Short read")
+                return vbuf[off:off + n]
+
+            for pattern in passes:
+                shred._gate(size)
+                tap = shred.verifier.tap([(0, size)]) if verify_fixed and size else None
+                if size:
+                    t0 = time.perf_counter()
+                    if pattern is None:
+                        buf = shred._random_buf(size)
+                        shred.random.readinto(buf)
+                        if ph is not None:
+                            t0 = ph.add("generate", t0, size)
+                    else:
+                        pat = shred.patterns.get(pattern, buf_len)
+                        buf = pat if size == buf_len else memoryview(pat)[:size]
+                    if os.pwrite(fd, buf, 0) != size:
+                        raise IOError("Short write")
+                    if ph is not None:
+                        t0 = ph.add("write", t0, size)
+                    if tap is not None:
+                        tap.update(buf)
+                        if ph is not None:
+                            ph.add("verify", t0)
+                    written += size
+                    if shred.progress is not None:
+                        shred.progress.advance(size)
+                t0 = time.perf_counter()
+                label = shred.durability.sync_pass(fd, size)
+                if ph is not None:
+                    ph.sync(t0)
+                if tap is not None:
+                    shred._gate(size)
+                    t0 = time.perf_counter()
+                    if not tap.check(read, size):
+                        raise IOError("Verification failed")
+                    if ph is not None:
+                        ph.add("verify", t0, tap.checked)
+            t0 = time.perf_counter()
+            shred.durability.sync_file(fd, label)
+            if shred.durability.batched and not syncfs_supported():
+                os.fsync(fd)
+            if ph is not None:
+                ph.add("fsync", t0)
+        finally:
+            os.close(fd)
+            if shred.progress is not None:
+                shred.progress.credit(size * len(passes) - written)
+        return label
@@ -0,0 +1,114 @@
+import os
+import sys
+import time
+import ctypes
+import platform
+import threading
+from typing import Callable, Optional, Tuple
+
+IOPRIO_CLASSES = {"rt": 1, "be": 2, "idle": 3}
+IOPRIO_CLASS_SHIFT = 13
+IOPRIO_WHO_PROCESS = 1
+
+_SYS_IOPRIO_SET = {"x86_64": 251, "i386": 289, "i686": 289, "aarch64": 30, "riscv64": 30,
+                   "armv7l": 314, "ppc64le": 273, "s390x": 282}
+
+MAX_SLEEP = 0.05
+
+class Throttle:
+    def __init__(self, mb_s: float = 0.0, iops: float = 0.0, burst_sec: float = 0.05):
+        self.burst_sec = burst_sec
+        self._cond = threading.Condition()
+        self._paused = False
+        self._byte_t = 0.0
+        self._op_t = 0.0
+        self.bytes_per_sec = 0.0
+        self.iops = 0.0
+        self.set_limits(mb_s, iops)
+
+    def set_limits(self, mb_s: float = 0.0, iops: float = 0.0):
+        with self._cond:
+            self.bytes_per_sec = max(0.0, mb_s) * 1024 * 1024
+            self.iops = max(0.0, iops)
+            self._byte_t = self._op_t = 0.0
+            self._cond.notify_all()
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    def pause(self):
+        with self._cond:
+            self._paused = True
+
+    def resume(self):
+        with self._cond:
+            self._paused = False
+            self._cond.notify_all()
+
+    def wake(self):
+        with self._cond:
+            self._cond.notify_all()
+
+    def wait(self, nbytes: int, cancelled: Callable[[], bool]) -> bool:
+        with self._cond:
+            while self._paused and not cancelled():
+                self._cond.wait(MAX_SLEEP * 4)
+            if cancelled():
+                return False
+            now = time.monotonic()
+            due = now
+            if self.bytes_per_sec > 0:
+                start = max(self._byte_t, now - self.burst_sec)
+                self._byte_t = start + nbytes / self.bytes_per_sec
+                due = max(due, self._byte_t - self.burst_sec)
+            if self.iops > 0:
+                start = max(self._op_t, now - self.burst_sec)
+                self._op_t = start + 1.0 / self.iops
+                due = max(due, self._op_t - self.burst_sec)
+        while not cancelled():
+            left = due - time.monotonic()
+            if left <= 0:
+                return True
+            with self._cond:
+                self._cond.wait(min(left, MAX_SLEEP))
+        return False
+
+def set_io_priority(cls: str, level: int = 4) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    nr = _SYS_IOPRIO_SET.get(platform.machine())
+    if nr is None:
+        return False
+    value = (IOPRIO_CLASSES[cls] << IOPRIO_CLASS_SHIFT) | (0 if cls == "idle" else max(0, min(7, level)))
+    libc = ctypes.CDLL(None, use_errno=True)
+    if libc.syscall(nr, IOPRIO_WHO_PROCESS, 0, value) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return True
+
+def parse_ionice(spec: str) -> Tuple[str, int]:
+    cls, _, level = spec.partition(":")
+    if cls not in IOPRIO_CLASSES:
+        raise ValueError(f"Unknown I/O class: {cls}")
+    n = int(level) if level else 4
+    if not 0 <= n <= 7:
+        raise ValueError(f"I/O priority level out of range: {n}")
+    return cls, n
+
+def apply_priority(ionice: Optional[Tuple[str, int]], nice: int, log: Callable[[str], None]):
+    if nice:
+        try:
+            os.nice(nice)
+            log(f"[INFO] nice +{nice}")
+        except (OSError, AttributeError) as e:
+            log(f"[WARN] nice failed: {e}")
+    if ionice:
+        cls, level = ionice
+        try:
+            if set_io_priority(cls, level):
+                log(f"[INFO] I/O priority {cls}" + ("" if cls == "idle" else f":{level}"))
+            else:
+                log("[WARN] I/O priority not supported on this platform")
+        except OSError as e:
+            log(f"[WARN] I/O priority failed: {e}")
@@ -0,0 +1,180 @@
+import abc
+import math
+import bisect
+import random
+import hashlib
+from typing import Callable, Dict, List, Tuple
+
+VERIFY_MODES = ("full", "sampled")
+
+SAMPLE_BLOCK = 1024 * 1024
+DEFAULT_COVERAGE = 0.01
+
+Reader = Callable[[int, int], memoryview]
+
+def _hasher():
+    return hashlib.blake2b(digest_size=16)
+
+def clip_extents(extents: List[Tuple[int, int]], start: int) -> List[Tuple[int, int]]:
+    out = []
+    for off, length in extents:
+        end = off + length
+        if end > start:
+            off = max(off, start)
+            out.append((off, end - off))
+    return out
+
+class PassDigest(abc.ABC):
+    def __init__(self, extents: List[Tuple[int, int]]):
+        self.extents = extents
+        self.pos = 0
+        self.checked = 0
+
+    def seek(self, off: int):
+        self.pos = off
+
+    def written(self, end: int):
+        self.extents = [(0, end)] if end else []
+
+    @abc.abstractmethod
+    def update(self, buf):
+        ...
+
+    def update_fill(self, pat: memoryview, length: int):
+        step = len(pat)
+        while length > 0:
+            n = min(step, length)
+            self.update(pat if n == step else pat[:n])
+            length -= n
+
+    @abc.abstractmethod
+    def check(self, read: Reader, piece: int) -> bool:
+        ...
+
+    def _digest_range(self, h, read: Reader, piece: int, off: int, length: int):
+        end = off + length
+        while off < end:
+            n = min(piece, end - off)
+            h.update(read(off, n))
+            off += n
+        self.checked += length
+
+class FullDigest(PassDigest):
+    def __init__(self, extents: List[Tuple[int, int]]):
+        super().__init__(extents)
+        self._written = _hasher()
+
+    def update(self, buf):
+        self._written.update(buf)
+        self.pos += len(buf)
+
+    def check(self, read: Reader, piece: int) -> bool:
+        h = _hasher()
+        for off, length in self.extents:
+            self._digest_range(h, read, piece, off, length)
+        return h.digest() == self._written.digest()
+
+class SampledDigest(PassDigest):
+    def __init__(self, extents: List[Tuple[int, int]], block: int, coverage: float, rng: random.Random):
+        super().__init__(extents)
+        self.block = block
+        spans: List[Tuple[int, int]] = []
+        for off, length in extents:
+            first, last = off // block, (off + length - 1) // block
+            if spans and first <= spans[-1][1]:
+                first = spans[-1][1] + 1
+            if first <= last:
+                spans.append((first, last))
+        bases = []
+        total = 0
+        for first, last in spans:
+            bases.append(total)
+            total += last - first + 1
+        k = min(total, max(1, math.ceil(total * coverage))) if total else 0
+        self.blocks: List[int] = []
+        for i in sorted(rng.sample(range(total), k)):
+            s = bisect.bisect_right(bases, i) - 1
+            self.blocks.append(spans[s][0] + i - bases[s])
+        self._hashes: Dict[int, object] = {}
+
+    def update(self, buf):
+        pos, end, block = self.pos, self.pos + len(buf), self.block
+        i = bisect.bisect_left(self.blocks, pos // block)
+        while i < len(self.blocks) and self.blocks[i] * block < end:
+            b = self.blocks[i]
+            lo, hi = max(pos, b * block), min(end, (b + 1) * block)
+            h = self._hashes.get(b)
+            if h is None:
+                h = self._hashes[b] = _hasher()
+            h.update(buf[lo - pos:hi - pos])
+            i += 1
+        self.pos = end
+
+    def _block_ranges(self, b: int, starts: List[int]) -> List[Tuple[int, int]]:
+        lo, hi = b * self.block, (b + 1) * self.block
+        out = []
+        i = max(0, bisect.bisect_right(starts, lo) - 1)
+        while i < len(self.extents) and self.extents[i][0] < hi:
+            off, length = self.extents[i]
+            s, e = max(off, lo), min(off + length, hi)
+            if s < e:
+                out.append((s, e - s))
+            i += 1
+        return out
+
+    def check(self, read: Reader, piece: int) -> bool:
+        starts = [off for off, _ in self.extents]
+        for b in self.blocks:
+            written = self._hashes.get(b)
+            if written is None:
+                return False
+            h = _hasher()
+            for off, length in self._block_ranges(b, starts):
+                self._digest_range(h, read, piece, off, length)
+            if h.digest() != written.digest():
+                return False
+        return True
+
+class StreamSampledDigest(SampledDigest):
+    def __init__(self, block: int, coverage: float, rng: random.Random):
+        PassDigest.__init__(self, [])
+        self.block = block
+        self.coverage = coverage
+        self.blocks = []
+        self._hashes = {}
+        self._rng = rng
+        self._next = 0
+
+    def update(self, buf):
+        last = (self.pos + len(buf) - 1) // self.block
+        while self._next <= last:
+            if self._next == 0 or self._rng.random() < self.coverage:
+                self.blocks.append(self._next)
+            self._next += 1
+        super().update(buf)
+
+class Verifier:
+    def __init__(self, mode: str = "full", coverage: float = DEFAULT_COVERAGE, block: int = SAMPLE_BLOCK):
+        if mode not in VERIFY_MODES:
+            raise ValueError(f"Unknown verify mode: {mode}")
+        if not 0 < coverage <= 1:
+            raise ValueError(f"Coverage must be in (0, 1]: {coverage}")
+        self.mode = mode
+        self.coverage = coverage
+        self.block = block
+        self._rng = random.SystemRandom()
+
+    @property
+    def level(self) -> str:
+        return "FULL" if self.mode == "full" else f"SAMPLED:{self.coverage * 100:g}%"
+
+    def tap(self, extents: List[Tuple[int, int]], start: int = 0) -> PassDigest:
+        extents = clip_extents(extents, start)
+        if self.mode == "full":
+            return FullDigest(extents)
+        return SampledDigest(extents, self.block, self.coverage, self._rng)
+
+    def stream_tap(self) -> PassDigest:
+        if self.mode == "full":
+            return FullDigest([])
+        return StreamSampledDigest(self.block, self.coverage, self._rng)